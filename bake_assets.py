@@ -0,0 +1,47 @@
+import os
+import sys
+import pygame
+from concurrent.futures import ProcessPoolExecutor
+from game.baked import BAKED_DIR, BAKED_IMAGES, baked_path, write_baked
+
+
+def display_pixel_format():
+    """Find the pygame.image.tobytes format matching the display's pixel layout"""
+    pygame.display.init()
+    screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    masks = screen.get_masks()[:3]
+    pygame.display.quit()
+
+    # XRGB8888 is stored as B, G, R, X bytes on little-endian machines
+    if masks == (0xFF0000, 0xFF00, 0xFF) and sys.byteorder == "little":
+        return "BGRA"
+    return "RGBX"
+
+
+def bake_image(job):
+    """Scale one image to its final size and write it as raw pixels"""
+    path, size, pixel_format = job
+    image = pygame.transform.scale(pygame.image.load(path), size)
+    write_baked(path, size, image, pixel_format)
+    return baked_path(path, size)
+
+
+def bake_assets():
+    """Bake every large image in a process pool, one job per image size"""
+    pixel_format = display_pixel_format()
+    jobs = [
+        (path, size, pixel_format)
+        for path, sizes in BAKED_IMAGES.items()
+        for size in sizes
+    ]
+
+    os.makedirs(BAKED_DIR, exist_ok=True)
+    with ProcessPoolExecutor() as pool:
+        for output in pool.map(bake_image, jobs):
+            print(f"Baked {output}")
+
+    print(f"Baked {len(jobs)} image(s) in {pixel_format} format to {BAKED_DIR}")
+
+
+if __name__ == "__main__":
+    bake_assets()
@@ -0,0 +1,86 @@
+import json
+import os
+import pygame
+from game.atlas import ATLAS_DIR, ATLAS_SPRITES, MANIFEST_PATH
+
+# Atlas page dimensions and spacing between packed sprites
+PAGE_SIZE = 1024
+PADDING = 2
+
+
+def pack_sprites(sizes):
+    """Shelf-pack a list of (width, height) sizes into atlas pages.
+
+    Returns a list of (page, x, y) placements in the same order as sizes.
+    """
+    placements = [None] * len(sizes)
+
+    # Pack tallest sprites first so shelves waste less space
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+
+    page = 0
+    shelf_x = shelf_y = shelf_height = 0
+    for i in order:
+        width, height = sizes[i]
+        if width > PAGE_SIZE or height > PAGE_SIZE:
+            raise ValueError(f"Sprite of size {width}x{height} doesn't fit on a page")
+
+        # Start a new shelf if this sprite doesn't fit on the current one
+        if shelf_x + width > PAGE_SIZE:
+            shelf_x = 0
+            shelf_y += shelf_height + PADDING
+            shelf_height = 0
+
+        # Start a new page if the shelf doesn't fit
+        if shelf_y + height > PAGE_SIZE:
+            page += 1
+            shelf_x = shelf_y = shelf_height = 0
+
+        placements[i] = (page, shelf_x, shelf_y)
+        shelf_x += width + PADDING
+        shelf_height = max(shelf_height, height)
+
+    return placements
+
+
+def build_atlas():
+    """Pre-scale every atlas sprite and pack them into pages with a manifest"""
+    entries = []
+    for path, sizes in ATLAS_SPRITES.items():
+        source = pygame.image.load(path)
+        for size in sizes:
+            entries.append((path, size, pygame.transform.scale(source, size)))
+
+    placements = pack_sprites([size for _, size, _ in entries])
+    page_count = max(page for page, _, _ in placements) + 1
+
+    pages = [
+        pygame.Surface((PAGE_SIZE, PAGE_SIZE), pygame.SRCALPHA)
+        for _ in range(page_count)
+    ]
+    manifest = {"pages": [], "sprites": []}
+
+    for (path, size, image), (page, x, y) in zip(entries, placements):
+        # Copy pixels exactly instead of alpha-blending onto the empty page
+        pages[page].blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        manifest["sprites"].append(
+            {"path": path, "size": list(size), "page": page, "rect": [x, y, *size]}
+        )
+
+    # Save the pages and manifest
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    for i, page in enumerate(pages):
+        filename = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(ATLAS_DIR, filename))
+        manifest["pages"].append(filename)
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(
+        f"Packed {len(entries)} sprites into {page_count} atlas page(s) in {ATLAS_DIR}"
+    )
+
+
+if __name__ == "__main__":
+    build_atlas()
@@ -0,0 +1,99 @@
+import fnmatch
+import glob
+import json
+import os
+import re
+import sys
+from game.pack import PACK_HEADER, PACK_MAGIC, PACK_PATH, PACK_VERSION
+
+# Directories and file types stored in the pack
+PACK_DIRS = ["assets/images", "assets/sounds", "assets/fonts"]
+PACK_EXTENSIONS = {".png", ".jpg", ".wav", ".mp3", ".ogg", ".ttf"}
+
+# Source files scanned for asset references
+SOURCE_FILES = ["main.py"] + sorted(glob.glob("game/*.py"))
+
+# Matches "assets/..." paths (including f-string placeholders) and sound bank names
+ASSET_PATH_RE = re.compile(r"[\"'](assets/(?:images|sounds)/[^\"']+)[\"']")
+SOUND_NAME_RE = re.compile(r"sound_bank\.get\(\s*[\"']([^\"']+)[\"']")
+
+
+def collect_assets():
+    """List every asset file that goes into the pack"""
+    paths = []
+    for directory in PACK_DIRS:
+        # Bundled fonts are optional
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if os.path.splitext(filename)[1].lower() in PACK_EXTENSIONS:
+                paths.append(f"{directory}/{filename}")
+    return paths
+
+
+def find_asset_references():
+    """Find the asset paths referenced by the game modules, as glob patterns"""
+    references = {}
+    for source in SOURCE_FILES:
+        with open(source) as f:
+            code = f.read()
+
+        for path in ASSET_PATH_RE.findall(code):
+            # Turn f-string placeholders like {veg_num} into wildcards
+            pattern = re.sub(r"\{[^}]*\}", "*", path)
+            references.setdefault(pattern, source)
+
+        for name in SOUND_NAME_RE.findall(code):
+            filename = name if os.path.splitext(name)[1] else f"{name}.wav"
+            references.setdefault(f"assets/sounds/{filename}", source)
+
+    return references
+
+
+def verify_references(paths):
+    """Print and return every referenced asset that isn't in the pack"""
+    missing = []
+    for pattern, source in sorted(find_asset_references().items()):
+        if not fnmatch.filter(paths, pattern):
+            print(f"Missing asset referenced in {source}: {pattern}")
+            missing.append(pattern)
+    return missing
+
+
+def build_pack(strict=False):
+    """Write every image and sound into one indexed pack file"""
+    paths = collect_assets()
+    missing = verify_references(paths)
+    if missing and strict:
+        print(f"Not building {PACK_PATH}: {len(missing)} referenced asset(s) missing")
+        return False
+
+    # Lay out the data after the header and index. The index stores absolute
+    # offsets, so its length has to settle before the offsets are final.
+    sizes = [os.path.getsize(path) for path in paths]
+    index_length = 0
+    while True:
+        offset = PACK_HEADER.size + index_length
+        index = {}
+        for path, size in zip(paths, sizes):
+            index[path] = [offset, size]
+            offset += size
+        index_data = json.dumps(index).encode()
+        if len(index_data) == index_length:
+            break
+        index_length = len(index_data)
+
+    with open(PACK_PATH, "wb") as pack:
+        pack.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, index_length))
+        pack.write(index_data)
+        for path in paths:
+            with open(path, "rb") as f:
+                pack.write(f.read())
+
+    print(f"Packed {len(paths)} assets into {PACK_PATH} ({offset} bytes)")
+    return True
+
+
+if __name__ == "__main__":
+    if not build_pack(strict="--strict" in sys.argv):
+        sys.exit(1)
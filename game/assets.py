@@ -0,0 +1,208 @@
+import pygame
+from collections import OrderedDict
+from .atlas import sprite_atlas
+from .backend import convert_surface
+from .baked import load_baked
+from .pack import open_asset
+from .manifest import asset_exists
+from .memory import surface_bytes, track
+
+# Default memory budget for cached surfaces (64 MB)
+DEFAULT_CACHE_BUDGET = 64 * 1024 * 1024
+
+# Colours tried, in order, for keying out a surface's transparent pixels
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 255), (1, 2, 3)]
+
+
+class SurfaceCache:
+    """Process-wide LRU cache of loaded, scaled and flipped image surfaces"""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BUDGET):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+
+        # Runtime counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def get(self, key):
+        """Return the cached surface for a key, or None if it isn't cached"""
+        surface = self._entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+
+        # Mark as most recently used
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key, surface):
+        """Store a surface and evict least recently used entries over budget"""
+        if key in self._entries:
+            self.bytes -= surface_bytes(self._entries.pop(key))
+
+        self._entries[key] = surface
+        self.bytes += surface_bytes(surface)
+        track(surface, "Cache", repr(key))
+        self._evict()
+
+    def set_budget(self, max_bytes):
+        """Change the byte budget, evicting entries if we're now over it"""
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Return a snapshot of the cache counters"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone is over budget
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, surface = self._entries.popitem(last=False)
+            self.bytes -= surface_bytes(surface)
+            self.evictions += 1
+
+
+# Shared cache used by every image load in the game
+surface_cache = SurfaceCache()
+
+
+def load_image(path, size=None, flip=False, alpha=True, owner=None):
+    """Load an image through the shared surface cache.
+
+    The result is keyed by (path, size, flip, alpha) and shared between
+    callers, so it must not be drawn on. If an owner is given the surface is
+    counted towards it in the memory registry. Raises the same errors as
+    pygame.image.load if the file can't be loaded.
+    """
+    if size is not None:
+        size = (int(size[0]), int(size[1]))
+    key = (path, size, flip, alpha)
+
+    surface = surface_cache.get(key)
+    if surface is None:
+        surface = normalize_surface(_build_image(path, size, flip, alpha), path)
+        surface_cache.put(key, surface)
+
+    if owner is not None:
+        track(surface, owner)
+    return surface
+
+
+def _build_image(path, size, flip, alpha):
+    # Build one variant of an image, reusing cached variants where possible
+    if flip:
+        # Build from the cached unflipped variant
+        surface = pygame.transform.flip(
+            load_image(path, size, False, alpha), True, False
+        )
+    elif size is not None:
+        # Prefer a pre-scaled atlas view for sprites, or a baked raw image
+        # for opaque backgrounds
+        if alpha:
+            surface = sprite_atlas.get(path, size)
+        else:
+            surface = load_baked(path, size)
+        if surface is None:
+            # Build from the cached full-size original
+            surface = pygame.transform.scale(load_image(path, None, False, alpha), size)
+    else:
+        # Missing files are known from the manifest, so don't try to open them
+        if not asset_exists(path):
+            raise FileNotFoundError(f"No file '{path}' found")
+        surface = pygame.image.load(open_asset(path), path)
+        surface = convert_surface(surface, alpha)
+    return surface
+
+
+def cached_surface(key, build, owner=None):
+    """Return the shared surface for a key, calling build() to make it on a miss"""
+    surface = surface_cache.get(key)
+    if surface is None:
+        surface = normalize_surface(build(), repr(key))
+        surface_cache.put(key, surface)
+
+    if owner is not None:
+        track(surface, owner)
+    return surface
+
+
+def normalize_surface(surface, label):
+    """Convert a surface to the cheapest display format that draws it the same.
+
+    Opaque surfaces are plainly converted, surfaces whose pixels are either
+    fully transparent or fully opaque are colour-keyed, and only the rest keep
+    per-pixel alpha. Transparent surfaces are run-length encoded.
+    """
+    # Without a display the pixels are converted when they're uploaded instead
+    if pygame.display.get_surface() is None:
+        return surface
+
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        surface = convert_surface(surface, alpha=False)
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        chosen = "colorkey"
+    elif not surface.get_flags() & pygame.SRCALPHA:
+        surface = convert_surface(surface, alpha=False)
+        chosen = "opaque"
+    else:
+        pixels = surface.get_width() * surface.get_height()
+        visible = pygame.mask.from_surface(surface, 0).count()
+        opaque = pygame.mask.from_surface(surface, 254).count()
+        keyed = None
+        if opaque == visible and surface.get_parent() is None:
+            keyed = _colorkey_surface(surface, pixels - opaque)
+
+        if opaque == pixels:
+            surface = convert_surface(surface, alpha=False)
+            chosen = "opaque"
+        elif keyed is not None:
+            surface = keyed
+            chosen = "colorkey"
+        else:
+            # Atlas sprites stay views of their page, so they keep their alpha
+            if surface.get_parent() is None:
+                surface = convert_surface(surface)
+            surface.set_alpha(255, pygame.RLEACCEL)
+            chosen = "alpha"
+
+    print(f"Surface {label}: {chosen}")
+    return surface
+
+
+def _colorkey_surface(surface, hidden):
+    # Draw a surface whose pixels are all fully transparent or fully opaque
+    # over a colour it doesn't use, and key that colour out. Returns None if
+    # every colour tried is used.
+    for key in COLORKEY_CANDIDATES:
+        keyed = pygame.Surface(surface.get_size()).convert()
+        keyed.fill(key)
+        keyed.blit(surface, (0, 0))
+        if pygame.mask.from_threshold(keyed, key, (1, 1, 1, 255)).count() == hidden:
+            keyed.set_colorkey(key, pygame.RLEACCEL)
+            return keyed
+    return None
+
+
+def load_facing_images(path, size=None, alpha=True, owner=None):
+    """Load the shared (right-facing, left-facing) variants of an image"""
+    return (
+        load_image(path, size, False, alpha, owner),
+        load_image(path, size, True, alpha, owner),
+    )
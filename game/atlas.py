@@ -0,0 +1,91 @@
+import json
+import os
+import pygame
+from .backend import convert_surface
+from .memory import track
+
+ATLAS_DIR = "assets/atlas"
+MANIFEST_PATH = os.path.join(ATLAS_DIR, "manifest.json")
+
+# Every sprite packed into the atlas, with the sizes the game draws it at
+ATLAS_SPRITES = {
+    # Regular (90x90) and main (180x180) enemies
+    "assets/images/veg_1.png": [(90, 90)],
+    "assets/images/veg_2.png": [(90, 90)],
+    "assets/images/veg_3.png": [(90, 90), (180, 180)],
+    "assets/images/veg_4.png": [(90, 90)],
+    "assets/images/veg_5.png": [(90, 90)],
+    "assets/images/banana_1.png": [(90, 90)],
+    "assets/images/banana_2.png": [(90, 90), (180, 180)],
+    "assets/images/banana_3.png": [(90, 90)],
+    "assets/images/banana_4.png": [(90, 90)],
+    "assets/images/gran_1.png": [(90, 90), (180, 180)],
+    "assets/images/gran_2.png": [(90, 90)],
+    "assets/images/gran_3.png": [(90, 90)],
+    # Player, bullet and level goal
+    "assets/images/boss_baby.png": [(100, 120)],
+    "assets/images/bullet.png": [(20, 10)],
+    "assets/images/bottle.png": [(210, 210)],
+    # Boss level
+    "assets/images/final_boss.png": [(200, 200)],
+    "assets/images/champ_belt.png": [(150, 100)],
+}
+
+
+class SpriteAtlas:
+    """Pre-scaled sprites packed into a few atlas pages, read from a manifest"""
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.loaded = False
+        self.pages = []
+        self.sprites = {}
+
+    def load(self):
+        """Load the manifest and decode every atlas page once"""
+        self.loaded = True
+
+        if not os.path.exists(self.manifest_path):
+            print("No sprite atlas found, loading sprites from individual files")
+            return
+
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+
+            atlas_dir = os.path.dirname(self.manifest_path)
+            self.pages = [
+                track(
+                    convert_surface(pygame.image.load(os.path.join(atlas_dir, page))),
+                    "Atlas",
+                    page,
+                )
+                for page in manifest["pages"]
+            ]
+            for entry in manifest["sprites"]:
+                key = (entry["path"], tuple(entry["size"]))
+                self.sprites[key] = (entry["page"], pygame.Rect(entry["rect"]))
+
+            print(
+                f"Loaded sprite atlas: {len(self.sprites)} sprites on {len(self.pages)} page(s)"
+            )
+        except Exception as e:
+            print(f"Error loading sprite atlas: {e}")
+            self.pages = []
+            self.sprites = {}
+
+    def get(self, path, size):
+        """Return a subsurface view of a packed sprite, or None if it isn't packed"""
+        if not self.loaded:
+            self.load()
+
+        entry = self.sprites.get((path, size))
+        if entry is None:
+            return None
+
+        page, rect = entry
+        return self.pages[page].subsurface(rect)
+
+
+# Shared atlas used by the asset loader
+sprite_atlas = SpriteAtlas()
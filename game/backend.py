@@ -0,0 +1,405 @@
+import weakref
+import pygame
+from .memory import track
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    # Older pygame builds don't ship the SDL2 render API
+    Window = None
+
+BACKENDS = ("software", "scaled", "texture")
+
+# Render scales the automatic mode steps through, from full resolution down.
+# Half resolution scales back up by a whole number, which is the fastest.
+SCALE_STEPS = (1.0, 0.5)
+
+# Frames averaged before the automatic mode changes the scale
+AUTO_SCALE_WINDOW = 60
+
+# Draw calls the texture backend keeps to rebuild its last frame from, before
+# it snapshots the frame into a single texture instead
+REPLAY_LIMIT = 256
+
+
+def convert_surface(surface, alpha=True):
+    """Convert a surface to the display's pixel format for fast blitting.
+
+    Without a display surface (the texture backend doesn't have one) pixels are
+    converted when they're uploaded instead, so this just copies the surface.
+    """
+    if pygame.display.get_surface() is None:
+        return surface.copy()
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+class SoftwareBackend:
+    """Draws with CPU blits onto the display surface"""
+
+    name = "software"
+
+    def __init__(self, size, title):
+        self.surface = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+
+        # Surface the frame is drawn into, for effects that work on its pixels
+        self.target = self.surface
+
+        # Drawing goes straight to the display surface, with no extra calls
+        self.blit = self.surface.blit
+        self.blits = self.surface.blits
+        self.fill = self.surface.fill
+        self.get_size = self.surface.get_size
+        self.get_width = self.surface.get_width
+        self.get_height = self.surface.get_height
+        self.get_rect = self.surface.get_rect
+
+    def mark_dirty(self, surface):
+        """Note that a surface's pixels changed since it was last drawn"""
+        # Surfaces are blitted straight from their pixels, so there's nothing to do
+
+    def copy(self):
+        """Return a snapshot of the current frame"""
+        return self.surface.copy()
+
+    def present(self, rects=None):
+        """Show the frame, or only the given areas of it"""
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+
+
+class ScaledBackend(SoftwareBackend):
+    """Renders into an offscreen surface at a lower resolution and scales it up.
+
+    Drawing still uses full-size screen coordinates. Each surface drawn is
+    scaled down once and kept until the surface is freed or marked dirty. At
+    a scale of 1 it draws straight to the display like the software backend.
+    """
+
+    name = "scaled"
+
+    def __init__(self, size, title, scale=1.0):
+        super().__init__(size, title)
+        self.size = size
+        self.scale = None
+        self._scaled = weakref.WeakKeyDictionary()
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        """Change the internal render resolution to a fraction of the screen"""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self._scaled.clear()
+
+        if scale == 1.0:
+            self.target = self.surface
+            self.blit = self.surface.blit
+            self.blits = self.surface.blits
+            self.fill = self.surface.fill
+        else:
+            self.target = pygame.Surface(
+                (round(self.size[0] * scale), round(self.size[1] * scale))
+            ).convert()
+            self.blit = self._blit
+            self.blits = self._blits
+            self.fill = self._fill
+        print(f"Render resolution {self.target.get_width()}x{self.target.get_height()}")
+
+    def mark_dirty(self, surface):
+        """Scale a surface again the next time it's drawn"""
+        self._scaled.pop(surface, None)
+
+    def copy(self):
+        """Return a full-size snapshot of the current frame"""
+        if self.target is self.surface:
+            return self.surface.copy()
+        return pygame.transform.scale(self.target, self.size)
+
+    def present(self, rects=None):
+        """Scale the frame up to the window and show it"""
+        if self.target is not self.surface:
+            pygame.transform.scale(self.target, self.size, self.surface)
+        super().present(rects)
+
+    def _blit(self, source, dest, area=None, special_flags=0):
+        rect = self.target.blit(*self._scale_blit(source, dest, area, special_flags))
+        return self._unscale(rect)
+
+    def _blits(self, blit_sequence, doreturn=True):
+        rects = self.target.blits(
+            [self._scale_blit(*entry) for entry in blit_sequence], doreturn
+        )
+        return [self._unscale(rect) for rect in rects] if doreturn else None
+
+    def _scale_blit(self, source, dest, area=None, special_flags=0):
+        # Turn a full-size blit into one onto the offscreen surface
+        scale = self.scale
+        position = (int(dest[0] * scale), int(dest[1] * scale))
+        if area is not None:
+            area = self._scale_rect(area)
+        return self._get_scaled(source), position, area, special_flags
+
+    def _fill(self, color, rect=None, special_flags=0):
+        if rect is not None:
+            rect = self._scale_rect(rect)
+        return self._unscale(self.target.fill(color, rect, special_flags))
+
+    def _scale_rect(self, rect):
+        rect = pygame.Rect(rect)
+        scale = self.scale
+        return pygame.Rect(
+            int(rect.x * scale),
+            int(rect.y * scale),
+            round(rect.width * scale),
+            round(rect.height * scale),
+        )
+
+    def _unscale(self, rect):
+        # Rects handed back to the game are in full-size screen coordinates
+        scale = self.scale
+        return pygame.Rect(
+            int(rect.x / scale),
+            int(rect.y / scale),
+            round(rect.width / scale),
+            round(rect.height / scale),
+        )
+
+    def _get_scaled(self, surface):
+        scaled = self._scaled.get(surface)
+        if scaled is None:
+            size = (
+                max(1, round(surface.get_width() * self.scale)),
+                max(1, round(surface.get_height() * self.scale)),
+            )
+            # Smooth scaling would blend colour-keyed edges into the sprite
+            if surface.get_bitsize() in (24, 32) and surface.get_colorkey() is None:
+                scaled = pygame.transform.smoothscale(surface, size)
+            else:
+                scaled = pygame.transform.scale(surface, size)
+
+            # Keep run-length encoding, which scaling drops
+            if surface.get_flags() & pygame.RLEACCEL:
+                colorkey = surface.get_colorkey()
+                if colorkey is not None:
+                    scaled.set_colorkey(colorkey, pygame.RLEACCEL)
+                else:
+                    scaled.set_alpha(surface.get_alpha(), pygame.RLEACCEL)
+            self._scaled[surface] = track(scaled, "Render", "scaled surface")
+        return scaled
+
+
+class ResolutionScaler:
+    """Lowers a scaled backend's resolution when frames go over budget.
+
+    Once frames are fast enough that the next resolution up would still fit
+    comfortably in the budget, it raises the resolution again.
+    """
+
+    def __init__(self, backend, budget_ms, steps=SCALE_STEPS, window=AUTO_SCALE_WINDOW):
+        self.backend = backend
+        self.budget_ms = budget_ms
+        self.steps = steps
+        self.window = window
+        self.step = 0
+        self._frame_times = []
+
+    def add_frame(self, frame_ms):
+        """Record how long a frame took to update and draw"""
+        self._frame_times.append(frame_ms)
+        if len(self._frame_times) < self.window:
+            return
+        average = sum(self._frame_times) / len(self._frame_times)
+        self._frame_times.clear()
+
+        step = self.step
+        if average > self.budget_ms and step < len(self.steps) - 1:
+            step += 1
+        elif step > 0:
+            # Drawing time grows with the number of pixels drawn
+            ratio = (self.steps[step - 1] / self.steps[step]) ** 2
+            if average * ratio < self.budget_ms * 0.8:
+                step -= 1
+
+        if step != self.step:
+            print(f"Average frame time {average:.1f} ms, changing render scale")
+            self.step = step
+            self.backend.set_scale(self.steps[step])
+
+
+class TextureBackend:
+    """Draws cached GPU textures through an SDL renderer.
+
+    Each surface is uploaded as a texture the first time it's drawn and reused
+    while the surface lives, so surfaces whose pixels change afterwards must be
+    passed to mark_dirty(). Subsurfaces, such as atlas sprites, draw from their
+    parent's texture.
+    """
+
+    name = "texture"
+
+    def __init__(self, size, title):
+        if Window is None:
+            raise RuntimeError("pygame._sdl2.video is not available")
+        self.window = Window(title, size)
+        self.renderer = Renderer(self.window)
+        self.rect = pygame.Rect((0, 0), size)
+        self._textures = weakref.WeakKeyDictionary()
+
+        # The frame only exists on the GPU, so there are no pixels to work on
+        self.target = None
+
+        # Draw calls of the frame being built and of the last one presented,
+        # so a frame can be shown again without the game redrawing it
+        self._frame = []
+        self._last_frame = []
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+    def get_rect(self, **kwargs):
+        rect = self.rect.copy()
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Draw a surface at a position, like Surface.blit"""
+        texture, offset = self._get_texture(source)
+        if area is None:
+            src = pygame.Rect(offset, source.get_size())
+        else:
+            src = pygame.Rect(area).clip(source.get_rect())
+            src.move_ip(offset)
+
+        dst = pygame.Rect(int(dest[0]), int(dest[1]), src.width, src.height)
+        opaque = (
+            not source.get_flags() & pygame.SRCALPHA
+            and source.get_colorkey() is None
+            and source.get_alpha() in (None, 255)
+        )
+        self._draw(("texture", texture, src, dst, opaque))
+        return dst.clip(self.rect)
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Draw a sequence of (surface, dest[, area]) entries, like Surface.blits"""
+        rects = [self.blit(*entry) for entry in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        """Fill the whole frame, or an area of it, with a colour"""
+        rect = self.rect.copy() if rect is None else pygame.Rect(rect)
+        self._draw(("fill", pygame.Color(color), rect))
+        return rect.clip(self.rect)
+
+    def mark_dirty(self, surface):
+        """Re-upload a surface's texture the next time it's drawn"""
+        self._textures.pop(surface, None)
+
+    def copy(self):
+        """Return a snapshot of the current frame"""
+        if not self._frame:
+            # Nothing drawn since the last present, so rebuild that frame
+            self._replay(self._last_frame)
+        return self.renderer.to_surface()
+
+    def present(self, rects=None):
+        """Show the frame.
+
+        The renderer can't keep the last frame's pixels, so if only some areas
+        were redrawn the frame is rebuilt from the last one's draw calls.
+        Calls hidden by a later full-screen opaque one are dropped, and if too
+        many are left the frame is kept as a snapshot texture instead.
+        """
+        if rects is not None or not self._frame:
+            frame = self._trim(self._last_frame + self._frame)
+            self.renderer.draw_color = (0, 0, 0, 255)
+            self.renderer.clear()
+            self._replay(frame)
+            if len(frame) > REPLAY_LIMIT:
+                frame = [self._snapshot()]
+        else:
+            frame = self._trim(self._frame)
+        self.renderer.present()
+        self._last_frame = frame
+        self._frame = []
+
+    def _trim(self, frame):
+        # Everything before the last call that paints over the whole screen
+        # is hidden, so it doesn't need replaying
+        for i in range(len(frame) - 1, 0, -1):
+            if self._covers_screen(frame[i]):
+                return frame[i:]
+        return frame
+
+    def _covers_screen(self, command):
+        if command[0] == "texture":
+            _, _, _, dst, opaque = command
+            return opaque and dst.contains(self.rect)
+        _, color, rect = command
+        return color.a == 255 and rect.contains(self.rect)
+
+    def _snapshot(self):
+        # Read back the frame just composed, before it's presented
+        texture = Texture.from_surface(self.renderer, self.renderer.to_surface())
+        return ("texture", texture, self.rect.copy(), self.rect.copy(), True)
+
+    def _get_texture(self, surface):
+        # Subsurfaces draw from the part of their parent they cover
+        offset = (0, 0)
+        parent = surface.get_abs_parent()
+        if (
+            parent is not surface
+            and parent.get_colorkey() == surface.get_colorkey()
+            and parent.get_alpha() == surface.get_alpha()
+        ):
+            offset = surface.get_abs_offset()
+            surface = parent
+
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture, offset
+
+    def _draw(self, command):
+        self._frame.append(command)
+        self._run(command)
+
+    def _replay(self, frame):
+        for command in frame:
+            self._run(command)
+
+    def _run(self, command):
+        if command[0] == "texture":
+            _, texture, src, dst, _ = command
+            texture.draw(src, dst)
+        else:
+            _, color, rect = command
+            self.renderer.draw_color = color
+            self.renderer.fill_rect(rect)
+
+
+def create_backend(name, size, title, scale=1.0):
+    """Open the game window with the named backend.
+
+    Falls back to the software backend if the texture one can't be created.
+    """
+    if name == "scaled":
+        return ScaledBackend(size, title, scale)
+    if name == "texture":
+        try:
+            backend = TextureBackend(size, title)
+            print("Using texture backend")
+            return backend
+        except Exception as e:
+            print(f"Texture backend unavailable, using software backend: {e}")
+    return SoftwareBackend(size, title)
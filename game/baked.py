@@ -0,0 +1,60 @@
+import mmap
+import os
+import struct
+import pygame
+from .backend import convert_surface
+
+BAKED_DIR = "assets/baked"
+
+# Large opaque images baked at their final on-screen size
+BAKED_IMAGES = {
+    "assets/images/level_2_background.jpg": [(1200, 800)],
+    "assets/images/level_3_background.jpg": [(1200, 800)],
+    "assets/images/background_boss_level.jpg": [(1200, 800)],
+}
+
+# Raw file header: magic, width, height, pygame.image.tobytes format name
+RAW_MAGIC = b"MBRW"
+RAW_HEADER = struct.Struct("<4sII8s")
+
+
+def baked_path(path, size):
+    """Return where the baked raw version of an image at a size is stored"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(BAKED_DIR, f"{name}_{size[0]}x{size[1]}.raw")
+
+
+def write_baked(path, size, surface, pixel_format):
+    """Write a surface as a raw baked image"""
+    header = RAW_HEADER.pack(RAW_MAGIC, size[0], size[1], pixel_format.encode())
+    with open(baked_path(path, size), "wb") as f:
+        f.write(header)
+        f.write(pygame.image.tobytes(surface, pixel_format))
+
+
+def load_baked(path, size):
+    """Rebuild a baked image from its memory-mapped raw file.
+
+    Returns None if the image hasn't been baked at this size.
+    """
+    raw_path = baked_path(path, size)
+    if not os.path.exists(raw_path):
+        return None
+
+    with open(raw_path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, width, height, pixel_format = RAW_HEADER.unpack_from(data)
+    if magic != RAW_MAGIC or (width, height) != size:
+        print(f"Ignoring invalid baked image: {raw_path}")
+        return None
+
+    # The surface reads its pixels straight out of the mapped file
+    surface = pygame.image.frombuffer(
+        memoryview(data)[RAW_HEADER.size :],
+        size,
+        pixel_format.rstrip(b"\0").decode(),
+    )
+
+    # Baked in the display's layout, so this is a plain pixel copy
+    return convert_surface(surface, alpha=False)
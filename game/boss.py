@@ -2,6 +2,11 @@ import pygame
 import math
 import os
 import random
+from .assets import cached_surface, load_image
+from .memory import track
+from .sounds import sound_bank
+from .fonts import get_font
+from .render_queue import LAYER_OVERLAY
 
 
 class Boss(pygame.sprite.Sprite):
@@ -24,36 +29,27 @@ class Boss(pygame.sprite.Sprite):
 
         # Load boss image
         try:
-            self.image = pygame.image.load(
-                "assets/images/final_boss.png"
-            ).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
+            self.image = load_image(
+                "assets/images/final_boss.png", (self.width, self.height), owner="Boss"
+            )
             print("Loaded final boss image!")
         except Exception as e:
             print(f"Error loading boss image: {e}")
-            # Create fallback image
-            self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            self.image.fill((200, 0, 0))  # Red background
-            pygame.draw.ellipse(
-                self.image, (150, 0, 0), (0, 0, self.width, self.height)
-            )
-            pygame.draw.ellipse(
-                self.image,
-                (250, 150, 150),
-                (self.width // 4, self.height // 4, self.width // 2, self.height // 2),
-            )
-            text_font = pygame.font.SysFont("Arial", 32)
-            text = text_font.render("BOSS", True, (255, 255, 255))
-            self.image.blit(
-                text,
-                (
-                    self.width // 2 - text.get_width() // 2,
-                    self.height // 2 - text.get_height() // 2,
-                ),
+            # Fallback image, built once and shared
+            self.image = cached_surface(
+                ("fallback", "boss", (self.width, self.height)),
+                self._create_fallback_image,
+                owner="Boss",
             )
 
         # Store original image for scaling
-        self.original_image = self.image.copy()
+        self.original_image = self.image
+
+        # Pre-scale every growth stage up front so hits only swap the image.
+        # The boss never mirrors, so only the right-facing image is needed.
+        self.growth_frames = [self.original_image]
+        for hits in range(1, self.health + 1):
+            self.growth_frames.append(self._scale_growth_frame(hits))
 
         # Set up rectangle and position
         self.rect = self.image.get_rect()
@@ -82,13 +78,31 @@ class Boss(pygame.sprite.Sprite):
         self.animation_timer = 0
         self.facing_right = True
 
-        # Sound effects
-        try:
-            self.hit_sound = pygame.mixer.Sound("assets/sounds/enemy_hit.wav")
-            self.jump_sound = pygame.mixer.Sound("assets/sounds/jump.wav")
-        except:
-            self.hit_sound = None
-            self.jump_sound = None
+        # Shared sound effects from the sound bank
+        self.hit_sound = sound_bank.get("enemy_hit", owner="Boss")
+        self.jump_sound = sound_bank.get("jump", owner="Boss")
+
+    def _create_fallback_image(self):
+        """Create a red BOSS placeholder if loading fails"""
+        # Create fallback image
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        image.fill((200, 0, 0))  # Red background
+        pygame.draw.ellipse(image, (150, 0, 0), (0, 0, self.width, self.height))
+        pygame.draw.ellipse(
+            image,
+            (250, 150, 150),
+            (self.width // 4, self.height // 4, self.width // 2, self.height // 2),
+        )
+        text_font = get_font("Arial", 32)
+        text = text_font.render("BOSS", True, (255, 255, 255))
+        image.blit(
+            text,
+            (
+                self.width // 2 - text.get_width() // 2,
+                self.height // 2 - text.get_height() // 2,
+            ),
+        )
+        return image
 
     def update(self, platforms, player):
         """Update boss behavior"""
@@ -210,15 +224,9 @@ class Boss(pygame.sprite.Sprite):
         self.health -= damage
         self.hits_taken += 1
 
-        # Grow in size by 5%
-        growth_factor = 1 + (0.05 * self.hits_taken)
-        self.width = int(self.base_width * growth_factor)
-        self.height = int(self.base_height * growth_factor)
-
-        # Scale the original image to new size
-        self.image = pygame.transform.scale(
-            self.original_image, (self.width, self.height)
-        )
+        # Grow in size by 5% by swapping to the pre-scaled image
+        self.image = self._growth_frame(self.hits_taken)
+        self.width, self.height = self.image.get_size()
 
         # Adjust rect to maintain position
         old_center = self.rect.center
@@ -239,28 +247,52 @@ class Boss(pygame.sprite.Sprite):
             f"Boss hit! Health: {self.health}, Size: {self.width}x{self.height}, Speed: {self.speed:.2f}"
         )
 
-    def draw_health_bar(self, screen):
-        """Draw the boss health bar at the top of the screen"""
+    def _scale_growth_frame(self, hits):
+        """Scale the original image for a number of hits taken"""
+        growth_factor = 1 + (0.05 * hits)
+        size = (
+            int(self.base_width * growth_factor),
+            int(self.base_height * growth_factor),
+        )
+        image = pygame.transform.scale(self.original_image, size)
+        return track(image, "Boss", f"growth stage {hits}")
+
+    def _growth_frame(self, hits):
+        """Return the pre-scaled boss image for a number of hits taken"""
+        # Extra bullets can land in the same frame as the defeating hit
+        while hits >= len(self.growth_frames):
+            self.growth_frames.append(self._scale_growth_frame(len(self.growth_frames)))
+        return self.growth_frames[hits]
+
+    def queue_health_bar(self, queue):
+        """Queue the boss health bar at the top of the screen"""
         bar_width = 500
         bar_height = 20
         bar_x = (self.screen_width - bar_width) // 2
         bar_y = 20
 
-        # Background (red)
-        pygame.draw.rect(screen, (200, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-
-        # Foreground (green) - proportional to health
-        health_percent = max(0, self.health / 25)  # Exactly 25 health max
-        pygame.draw.rect(
-            screen,
-            (0, 200, 0),
-            (bar_x, bar_y, int(bar_width * health_percent), bar_height),
+        # Red background and green fill proportional to health, both bordered
+        queue.add_health_bar(
+            (bar_x, bar_y),
+            bar_width,
+            bar_height,
+            max(0, self.health / 25),  # Exactly 25 health max
+            back_color=(200, 0, 0),
+            fill_color=(0, 200, 0),
+            border=2,
         )
 
-        # Border
-        pygame.draw.rect(screen, (0, 0, 0), (bar_x, bar_y, bar_width, bar_height), 2)
-
-        # Text - show X/25 shots
-        font = pygame.font.SysFont("Arial", 18)
-        text = font.render(f"Boss Health: {self.health}/25", True, (255, 255, 255))
-        screen.blit(text, (bar_x + 10, bar_y + (bar_height - text.get_height()) // 2))
+        # Text - show X/25 shots, rendered once per health value
+        font = get_font("Arial", 18)
+        text = cached_surface(
+            ("boss health text", self.health),
+            lambda: font.render(
+                f"Boss Health: {self.health}/25", True, (255, 255, 255)
+            ),
+            owner="Boss",
+        )
+        queue.add(
+            text,
+            (bar_x + 10, bar_y + (bar_height - text.get_height()) // 2),
+            LAYER_OVERLAY,
+        )
@@ -4,6 +4,11 @@ import math
 from .player import Player
 from .platform import Platform
 from .boss import Boss
+from .assets import cached_surface, load_image
+from .sounds import sound_bank
+from .fonts import get_font
+from .hud import HUD
+from .render_queue import RenderQueue, LAYER_BOSS, LAYER_PLAYER, LAYER_BULLETS
 
 
 class BossLevel:
@@ -32,28 +37,25 @@ class BossLevel:
 
         # Load boss level background
         try:
-            self.background_image = pygame.image.load(
-                "assets/images/background_boss_level.jpg"
-            ).convert()
-            self.background_image = pygame.transform.scale(
-                self.background_image, (self.screen_width, self.screen_height)
+            self.background_image = load_image(
+                "assets/images/background_boss_level.jpg",
+                (self.screen_width, self.screen_height),
+                alpha=False,
+                owner="Level",
             )
             print("Loaded boss background image!")
         except Exception as e:
             print(f"Failed to load boss background: {e}")
-            # Create fallback background
-            self.background_image = pygame.Surface(
-                (self.screen_width, self.screen_height)
+            # Fallback image, built once and shared
+            self.background_image = cached_surface(
+                (
+                    "fallback",
+                    "boss_background",
+                    (self.screen_width, self.screen_height),
+                ),
+                self._create_fallback_background,
+                owner="Level",
             )
-            self.background_image.fill((50, 0, 0))  # Dark red background
-
-            # Add some details to the background
-            for i in range(50):
-                x = random.randint(0, self.screen_width)
-                y = random.randint(0, self.screen_height)
-                size = random.randint(2, 6)
-                color = (random.randint(100, 200), 0, 0)  # Reddish colors
-                pygame.draw.circle(self.background_image, color, (x, y), size)
 
         # Create player
         player_x = 100
@@ -92,41 +94,60 @@ class BossLevel:
 
         # Load champion belt image
         try:
-            self.champ_belt_img = pygame.image.load(
-                "assets/images/champ_belt.png"
-            ).convert_alpha()
-            self.champ_belt_img = pygame.transform.scale(
-                self.champ_belt_img, (150, 100)
+            self.champ_belt_img = load_image(
+                "assets/images/champ_belt.png", (150, 100), owner="Level"
             )
             print("Loaded champion belt image!")
         except Exception as e:
             print(f"Error loading champion belt image: {e}")
-            # Create fallback image
-            self.champ_belt_img = pygame.Surface((150, 100), pygame.SRCALPHA)
-            self.champ_belt_img.fill((255, 215, 0))  # Gold color
-            pygame.draw.rect(
-                self.champ_belt_img, (200, 150, 0), (10, 30, 130, 40), border_radius=10
+            # Fallback image, built once and shared
+            self.champ_belt_img = cached_surface(
+                ("fallback", "champ_belt", (150, 100)),
+                self._create_fallback_belt,
+                owner="Level",
             )
-            font = pygame.font.SysFont("Arial", 24)
-            text = font.render("CHAMPION", True, (255, 255, 255))
-            self.champ_belt_img.blit(text, (25, 35))
 
         # Boss music
-        try:
-            self.boss_music = pygame.mixer.Sound("assets/sounds/boss_music.mp3")
+        self.boss_music = sound_bank.get("boss_music.mp3", owner="Level")
+        if self.boss_music:
             self.boss_music.set_volume(0.7)
             self.boss_music.play(-1)  # Loop indefinitely
             print("Boss music started playing!")
-        except Exception as e:
-            print(f"Failed to load boss music: {e}")
-            self.boss_music = None
 
         # Sound effects
-        try:
-            self.victory_sound = pygame.mixer.Sound("assets/sounds/level_complete.wav")
-        except:
-            print("Warning: Victory sound not found")
-            self.victory_sound = None
+        self.victory_sound = sound_bank.get("level_complete", owner="Level")
+
+        # Sprites are queued during render and blitted a layer at a time
+        self.render_queue = RenderQueue()
+
+        # Retained HUD, redrawn only when the values it shows change
+        self.hud = HUD(self.screen_width, self.screen_height)
+
+    def _create_fallback_background(self):
+        """Create a dark red background if loading fails"""
+        # Create fallback background
+        image = pygame.Surface((self.screen_width, self.screen_height))
+        image.fill((50, 0, 0))  # Dark red background
+
+        # Add some details to the background
+        for i in range(50):
+            x = random.randint(0, self.screen_width)
+            y = random.randint(0, self.screen_height)
+            size = random.randint(2, 6)
+            color = (random.randint(100, 200), 0, 0)  # Reddish colors
+            pygame.draw.circle(image, color, (x, y), size)
+        return image
+
+    def _create_fallback_belt(self):
+        """Create a gold CHAMPION badge if loading fails"""
+        # Create fallback image
+        image = pygame.Surface((150, 100), pygame.SRCALPHA)
+        image.fill((255, 215, 0))  # Gold color
+        pygame.draw.rect(image, (200, 150, 0), (10, 30, 130, 40), border_radius=10)
+        font = get_font("Arial", 24)
+        text = font.render("CHAMPION", True, (255, 255, 255))
+        image.blit(text, (25, 35))
+        return image
 
     def _generate_platforms(self):
         """Generate platforms for the boss level"""
@@ -314,122 +335,33 @@ class BossLevel:
 
         # Draw platforms
         for platform in self.platforms:
-            screen.blit(platform.image, platform.rect)
+            platform.draw(screen)
 
-        # Draw player
-        screen.blit(self.player.image, self.player.rect)
-
-        # Draw player bullets
+        # Queue player and bullets
+        queue = self.render_queue
+        queue.add(self.player.image, self.player.rect, LAYER_PLAYER)
         for bullet in self.player.bullets:
-            screen.blit(bullet.image, bullet.rect)
+            queue.add(bullet.image, bullet.rect, LAYER_BULLETS)
 
-        # Draw boss only if not defeated
+        # Queue boss only if not defeated
         if not self.boss_defeated:
-            screen.blit(self.boss.image, self.boss.rect)
-            # Draw boss health bar
-            self.boss.draw_health_bar(screen)
-        # Draw champion belt if boss is defeated
+            queue.add(self.boss.image, self.boss.rect, LAYER_BOSS)
+            # Boss health bar
+            self.boss.queue_health_bar(queue)
+        # Queue champion belt if boss is defeated
         elif self.champ_belt_rect:
-            screen.blit(self.champ_belt_img, self.champ_belt_rect)
+            queue.add(self.champ_belt_img, self.champ_belt_rect, LAYER_BOSS)
+
+        # Draw everything queued, a layer at a time
+        queue.flush(screen)
 
         # Draw UI elements
         self._draw_ui(screen)
 
     def _draw_ui(self, screen):
         """Draw UI elements"""
-
-        # Helper function to render text with shadow/outline for better visibility
-        def render_text_with_shadow(
-            text,
-            font,
-            color,
-            position,
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-            bg_color=None,
-        ):
-            # Render shadow
-            shadow_surface = font.render(text, True, shadow_color)
-            shadow_position = (position[0] + shadow_offset, position[1] + shadow_offset)
-
-            # Create text surface
-            text_surface = font.render(text, True, color)
-            text_width, text_height = text_surface.get_size()
-
-            # Create background if requested
-            if bg_color:
-                # Add padding around text
-                padding = 5
-                bg_rect = pygame.Rect(
-                    position[0] - padding,
-                    position[1] - padding,
-                    text_width + padding * 2,
-                    text_height + padding * 2,
-                )
-                pygame.draw.rect(screen, bg_color, bg_rect, border_radius=4)
-
-            # Draw shadow and text
-            screen.blit(shadow_surface, shadow_position)
-            screen.blit(text_surface, position)
-
-            return text_surface
-
-        # Top panel - semi-transparent background for top UI
-        top_panel_height = 80
-        top_panel = pygame.Surface(
-            (self.screen_width, top_panel_height), pygame.SRCALPHA
-        )
-        top_panel.fill((0, 0, 0, 160))  # Black with 60% transparency
-        screen.blit(top_panel, (0, 0))
-
-        # Draw score with shadow
-        font = pygame.font.SysFont("comicsans", 30)
-        score_text = f"Score: {self.score}"
-        render_text_with_shadow(
-            score_text,
-            font,
-            (255, 255, 0),
-            (20, 20),
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-        )
-
-        # Draw player health bar
-        health_width = 200
-        health_height = 20
-        health_x = self.screen_width - health_width - 20
-        health_y = 20
-
-        # Black border around health bar
-        pygame.draw.rect(
-            screen,
-            (0, 0, 0),
-            (health_x - 2, health_y - 2, health_width + 4, health_height + 4),
-        )
-
-        # Background (red)
-        pygame.draw.rect(
-            screen, (255, 0, 0), (health_x, health_y, health_width, health_height)
-        )
-
-        # Foreground (green) - proportional to health
-        health_percent = self.player.health / self.player.max_health
-        pygame.draw.rect(
-            screen,
-            (0, 255, 0),
-            (health_x, health_y, int(health_width * health_percent), health_height),
-        )
-
-        # Health text with shadow
-        health_text = f"Health: {self.player.health}"
-        render_text_with_shadow(
-            health_text,
-            font,
-            (255, 255, 0),
-            (health_x, health_y + health_height + 5),
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-        )
+        self.hud.update(self.score, self.player.health, self.player.max_health)
+        self.hud.draw(screen)
 
     def cleanup(self):
         """Clean up resources when level is done"""
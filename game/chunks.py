@@ -0,0 +1,74 @@
+import pygame
+from collections import OrderedDict
+from .memory import track
+
+# Most chunks kept baked at once: the two on screen, one ahead and one behind
+MAX_CHUNKS = 4
+
+
+class WorldChunks:
+    """Bakes the level's static geometry into screen-wide transparent chunks.
+
+    Chunks are built lazily as the camera reaches them, one chunk ahead of the
+    direction it's scrolling, and the least recently used ones are dropped
+    once more than max_chunks are baked.
+    """
+
+    def __init__(
+        self, level_width, chunk_width, top, bottom, draw, max_chunks=MAX_CHUNKS
+    ):
+        # draw(surface, offset_x, offset_y) paints the static objects that
+        # overlap the surface, with the surface's top-left at that offset
+        self.chunk_width = chunk_width
+        self.chunk_count = -(-level_width // chunk_width)
+        self.top = top
+        self.height = bottom - top
+        self.max_chunks = max_chunks
+        self._draw = draw
+        self._chunks = OrderedDict()
+        self._last_camera_x = None
+
+        # Runtime counters
+        self.builds = 0
+
+    def draw(self, screen, camera_x):
+        """Blit the chunks the camera can see, building any that are missing"""
+        first = camera_x // self.chunk_width
+        last = (camera_x + screen.get_width()) // self.chunk_width
+
+        blits = []
+        for index in range(max(0, first), min(last, self.chunk_count - 1) + 1):
+            chunk = self._get(index)
+            blits.append((chunk, (index * self.chunk_width - camera_x, self.top)))
+        screen.blits(blits, doreturn=False)
+
+        # Bake the next chunk in the direction we're scrolling before it's needed
+        if self._last_camera_x is not None and camera_x != self._last_camera_x:
+            ahead = last + 1 if camera_x > self._last_camera_x else first - 1
+            if 0 <= ahead < self.chunk_count:
+                self._get(ahead)
+        self._last_camera_x = camera_x
+
+    def clear(self):
+        """Drop every baked chunk"""
+        self._chunks.clear()
+
+    def _get(self, index):
+        chunk = self._chunks.get(index)
+        if chunk is None:
+            chunk = self._build(index)
+            self._chunks[index] = chunk
+            while len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+        self._chunks.move_to_end(index)
+        return chunk
+
+    def _build(self, index):
+        chunk = pygame.Surface((self.chunk_width, self.height), pygame.SRCALPHA)
+        chunk.fill((0, 0, 0, 0))
+        self._draw(chunk, index * self.chunk_width, self.top)
+        # Chunks are mostly empty, so run-length encoding lets blits skip the gaps
+        chunk.set_alpha(255, pygame.RLEACCEL)
+        track(chunk, "Level", f"world chunk {index}")
+        self.builds += 1
+        return chunk
@@ -0,0 +1,202 @@
+import math
+import random
+import pygame
+from .assets import cached_surface
+from .memory import track
+from .parallax import compose_strip
+
+# Colour that's keyed out of the decoration tiles
+TRANSPARENT = (255, 0, 255)
+
+# Jungle trees: a trunk with three vines swaying from its middle
+TRUNK_WIDTH = 60
+TRUNK_COLOR = (101, 67, 33)
+VINE_COLOR = (50, 205, 50)
+VINE_SWAY = 80
+VINE_WIDTH = 3
+TREE_SPACING = 250
+
+# Supermarket shelves
+SHELF_WIDTH = 250
+SHELF_COLOR = (169, 169, 169)
+PRODUCT_COLORS = [
+    (255, 0, 0),
+    (0, 255, 0),
+    (0, 0, 255),
+    (255, 255, 0),
+    (255, 0, 255),
+]
+# Different product layouts to cycle through along the aisle
+SHELF_VARIANTS = 4
+SHELF_SPACING = 300
+SHELF_TOP = 50
+
+# Near scenery scrolling between the backgrounds and the level
+CLOUD_SPACING = 400
+CLOUD_COLOR = (255, 255, 255)
+BUSH_SPACING = 180
+BUSH_HEIGHT = 70
+BUSH_COLOR = (20, 90, 20)
+SIGN_SPACING = 450
+SIGN_TOP = 90
+SIGN_COLOR = (30, 90, 160)
+WIRE_COLOR = (90, 90, 90)
+
+
+def get_trunk_strip(min_width, height):
+    """Return the cached strip of tree trunks, transparent between them.
+
+    Trunks start at multiples of TREE_SPACING.
+    """
+
+    def draw(strip, offset_x):
+        pygame.draw.rect(strip, TRUNK_COLOR, (offset_x, 0, TRUNK_WIDTH, height))
+
+    return cached_surface(
+        ("decoration", "trunks", min_width, height),
+        lambda: compose_strip(TREE_SPACING, height, min_width, draw, opaque=False),
+        owner="Level",
+    )
+
+
+def _vine_lines(timer):
+    """Return the top and bottom x of each vine, relative to the trunk's left edge"""
+    lines = []
+    for j in range(3):
+        vine_x = 30 + (j * 10)
+        lines.append((vine_x, round(vine_x + VINE_SWAY * math.sin(timer / 100 + j))))
+    return lines
+
+
+class VineTile:
+    """The vines hanging from a trunk, redrawn as they sway.
+
+    Every tree sways together, so one tile is drawn at each of them. It's wide
+    enough for the vines' whole sway and starts left pixels from the trunk.
+    Backends that keep a copy of it must be told when it changes.
+    """
+
+    def __init__(self, height):
+        self.left = 30 - VINE_SWAY - VINE_WIDTH
+        width = 50 + VINE_SWAY + VINE_WIDTH - self.left
+        # Keyed surfaces in the display format blit far faster than 8-bit ones
+        self.surface = track(pygame.Surface((width, height)), "Level", "vines")
+        self.surface.set_colorkey(TRANSPARENT)
+        self.lines = None
+
+    def update(self, timer):
+        """Redraw the vines for a point in time, returning whether they moved"""
+        lines = _vine_lines(timer)
+        if lines == self.lines:
+            return False
+        self.lines = lines
+
+        height = self.surface.get_height()
+        self.surface.fill(TRANSPARENT)
+        for top_x, bottom_x in lines:
+            pygame.draw.line(
+                self.surface,
+                VINE_COLOR,
+                (top_x - self.left, 0),
+                (bottom_x - self.left, height),
+                VINE_WIDTH,
+            )
+        return True
+
+
+def get_shelf_tile(variant, height):
+    """Return the cached shelf with its products for one of the layouts"""
+
+    def build():
+        tile = pygame.Surface((SHELF_WIDTH, height))
+        tile.fill(SHELF_COLOR)
+
+        # Seeded per layout so products keep their colours between frames
+        rng = random.Random(variant)
+        for j in range(5):
+            for k in range(3):
+                pygame.draw.rect(
+                    tile,
+                    rng.choice(PRODUCT_COLORS),
+                    (20 + j * 40, 50 + k * 150, 30, 40),
+                )
+        return tile
+
+    return cached_surface(
+        ("decoration", "shelf", variant, height), build, owner="Level"
+    )
+
+
+def get_shelf_strip(min_width, height, background):
+    """Return the cached strip of every shelf layout in turn on a background colour.
+
+    Shelves start at multiples of SHELF_SPACING.
+    """
+
+    def draw(strip, offset_x):
+        strip.fill(background, (offset_x, 0, SHELF_SPACING * SHELF_VARIANTS, height))
+        for variant in range(SHELF_VARIANTS):
+            shelf = get_shelf_tile(variant, height - 2 * SHELF_TOP)
+            strip.blit(shelf, (offset_x + variant * SHELF_SPACING, SHELF_TOP))
+
+    return cached_surface(
+        ("decoration", "shelves", min_width, height, background),
+        lambda: compose_strip(SHELF_SPACING * SHELF_VARIANTS, height, min_width, draw),
+        owner="Level",
+    )
+
+
+def get_cloud_strip(min_width, height):
+    """Return the cached strip of clouds, transparent around them"""
+
+    def draw(strip, offset_x):
+        # Seeded per period so the clouds are the same every time
+        rng = random.Random(offset_x)
+        size = rng.randint(40, 70)
+        cloud_x = offset_x + rng.randint(size, CLOUD_SPACING - size)
+        cloud_y = rng.randint(size, height - size)
+        # Overlapping circles, like the sky background's clouds
+        for dx, dy in ((0, 0), (size // 2, -size // 3), (-size // 2, -size // 4)):
+            pygame.draw.circle(
+                strip, CLOUD_COLOR, (cloud_x + dx, cloud_y + dy), size // 2
+            )
+
+    return cached_surface(
+        ("decoration", "clouds", min_width, height),
+        lambda: compose_strip(CLOUD_SPACING, height, min_width, draw, opaque=False),
+        owner="Level",
+    )
+
+
+def get_bush_strip(min_width):
+    """Return the cached strip of bushes, BUSH_HEIGHT tall and flat along the bottom"""
+
+    def draw(strip, offset_x):
+        rng = random.Random(offset_x)
+        for i in range(3):
+            # Domes whose lower halves fall off the bottom of the strip
+            radius = rng.randint(BUSH_HEIGHT - 30, BUSH_HEIGHT)
+            center = (offset_x + 45 + i * 45, BUSH_HEIGHT)
+            pygame.draw.circle(strip, BUSH_COLOR, center, radius)
+
+    return cached_surface(
+        ("decoration", "bushes", min_width),
+        lambda: compose_strip(BUSH_SPACING, BUSH_HEIGHT, min_width, draw, opaque=False),
+        owner="Level",
+    )
+
+
+def get_sign_strip(min_width):
+    """Return the cached strip of aisle signs hanging from the top of the screen"""
+    height = SIGN_TOP + 40
+
+    def draw(strip, offset_x):
+        for wire_x in (offset_x + 60, offset_x + 160):
+            pygame.draw.line(strip, WIRE_COLOR, (wire_x, 0), (wire_x, SIGN_TOP), 2)
+        pygame.draw.rect(strip, SIGN_COLOR, (offset_x + 40, SIGN_TOP, 140, 40))
+
+    return cached_surface(
+        ("decoration", "signs", min_width),
+        lambda: compose_strip(SIGN_SPACING, height, min_width, draw, opaque=False),
+        owner="Level",
+    )
@@ -1,7 +1,9 @@
 import pygame
 import random
 import math
-import os
+from .assets import cached_surface, load_facing_images, load_image
+from .sounds import sound_bank
+from .manifest import asset_exists
 
 
 class Enemy(pygame.sprite.Sprite):
@@ -42,21 +44,22 @@ class Enemy(pygame.sprite.Sprite):
             self.width *= 2
             self.height *= 2
 
-        # Image loading based on enemy type
-        self.image = self._load_enemy_image(enemy_type)
+        # Right- and left-facing images based on enemy type
+        images = self._load_enemy_images(enemy_type)
 
-        # If image loading failed, create placeholder image
-        if self.image is None:
-            self.image = self._create_fallback_image(enemy_type)
+        # If image loading failed, use shared placeholder images
+        if images is None:
+            images = self._get_fallback_images(enemy_type)
+
+        # Turning around just swaps between the two variants
+        self.original_image, self.flipped_image = images
+        self.image = self.original_image
+        self.facing_right = True
 
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
-        # Store original image for flipping
-        self.original_image = self.image.copy()
-        self.facing_right = True
-
         # Movement properties
         self.vel_x = random.choice([-2, 2])
         self.vel_y = 0
@@ -89,20 +92,16 @@ class Enemy(pygame.sprite.Sprite):
             500 if is_main else 300
         )  # Increased range for main enemies
 
-        # Load sound effects
-        try:
-            self.hit_sound = pygame.mixer.Sound("assets/sounds/enemy_hit.wav")
-            if self.can_shoot:
-                self.shoot_sound = pygame.mixer.Sound("assets/sounds/enemy_shoot.wav")
-            else:
-                self.shoot_sound = None
-        except:
-            self.hit_sound = None
+        # Shared sound effects from the sound bank
+        self.hit_sound = sound_bank.get("enemy_hit", owner="Enemy")
+        if self.can_shoot:
+            self.shoot_sound = sound_bank.get("enemy_shoot", owner="Enemy")
+        else:
             self.shoot_sound = None
 
-    def _load_enemy_image(self, enemy_type):
-        """Load the appropriate enemy image based on type"""
-        image = None
+    def _load_enemy_images(self, enemy_type):
+        """Load the right- and left-facing enemy images based on type"""
+        images = None
         try:
             # Select a specific image for main enemies, or random for regular enemies
             if enemy_type == "vegetables":
@@ -139,9 +138,10 @@ class Enemy(pygame.sprite.Sprite):
                 return None
 
             # Load and scale the image
-            if os.path.exists(image_path):
-                image = pygame.image.load(image_path).convert_alpha()
-                image = pygame.transform.scale(image, (self.width, self.height))
+            if asset_exists(image_path):
+                images = load_facing_images(
+                    image_path, (self.width, self.height), owner="Enemy"
+                )
                 print(
                     f"Loaded {'main ' if self.is_main else ''}enemy image: {image_path}"
                 )
@@ -150,13 +150,10 @@ class Enemy(pygame.sprite.Sprite):
         except Exception as e:
             print(f"Error loading enemy image: {e}")
 
-        return image
-
-    def _create_fallback_image(self, enemy_type):
-        """Create a simple placeholder image if loading fails"""
-        image = pygame.Surface((self.width, self.height))
+        return images
 
-        # Color and appearance based on enemy type
+    def _get_fallback_images(self, enemy_type):
+        """Get the right- and left-facing placeholder images, built once per look"""
         if enemy_type == "vegetables":
             # Random vegetable color
             colors = [
@@ -166,6 +163,26 @@ class Enemy(pygame.sprite.Sprite):
                 (139, 69, 19),  # Brown (potato)
             ]
             color = colors[random.randint(0, len(colors) - 1)]
+        else:
+            color = None
+
+        key = ("fallback", enemy_type, (self.width, self.height), color)
+        image = cached_surface(
+            key, lambda: self._create_fallback_image(enemy_type, color), owner="Enemy"
+        )
+        flipped_image = cached_surface(
+            key + ("flipped",),
+            lambda: pygame.transform.flip(image, True, False),
+            owner="Enemy",
+        )
+        return image, flipped_image
+
+    def _create_fallback_image(self, enemy_type, color=None):
+        """Create a simple placeholder image if loading fails"""
+        image = pygame.Surface((self.width, self.height))
+
+        # Color and appearance based on enemy type
+        if enemy_type == "vegetables":
             image.fill(color)
             # Draw vegetable features
             pygame.draw.circle(image, (0, 100, 0), (self.width // 2, 15), 10)
@@ -225,10 +242,10 @@ class Enemy(pygame.sprite.Sprite):
         # Update facing direction based on movement
         if self.vel_x > 0 and not self.facing_right:
             self.facing_right = True
-            self.image = self.original_image.copy()
+            self.image = self.original_image
         elif self.vel_x < 0 and self.facing_right:
             self.facing_right = False
-            self.image = pygame.transform.flip(self.original_image, True, False)
+            self.image = self.flipped_image
 
         # Decrease attack cooldown
         if self.attack_cooldown > 0:
@@ -247,10 +264,10 @@ class Enemy(pygame.sprite.Sprite):
                 # Face the player before shooting
                 if player.rect.centerx > self.rect.centerx and not self.facing_right:
                     self.facing_right = True
-                    self.image = self.original_image.copy()
+                    self.image = self.original_image
                 elif player.rect.centerx < self.rect.centerx and self.facing_right:
                     self.facing_right = False
-                    self.image = pygame.transform.flip(self.original_image, True, False)
+                    self.image = self.flipped_image
 
                 # If we can see the player, shoot!
                 if can_see_player:
@@ -495,35 +512,24 @@ class EnemyProjectile(pygame.sprite.Sprite):
             else:
                 image_path = None
 
-            if image_path and os.path.exists(image_path):
-                self.image = pygame.image.load(image_path).convert_alpha()
-                self.image = pygame.transform.scale(
-                    self.image, (self.width, self.height)
+            if image_path and asset_exists(image_path):
+                # Use the flipped variant if shooting left
+                self.image = load_image(
+                    image_path,
+                    (self.width, self.height),
+                    flip=not direction_right,
+                    owner="Enemy",
                 )
-
-                # Flip the image if shooting left
-                if not direction_right:
-                    self.image = pygame.transform.flip(self.image, True, False)
         except Exception as e:
             print(f"Failed to load projectile image: {e}")
 
-        # Create fallback image if loading failed
+        # Use the shared fallback image if loading failed
         if self.image is None:
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill(self.color)
-            # Add a trail effect
-            trail_color = (255, 255, 255)  # White trail
-            trail_width = self.width // 3
-            if direction_right:
-                trail_x = 0
-            else:
-                trail_x = self.width - trail_width
-            pygame.draw.rect(
-                self.image,
-                trail_color,
-                (trail_x, self.height // 3, trail_width, self.height // 3),
+            self.image = cached_surface(
+                ("fallback", "projectile", enemy_type, direction_right),
+                lambda: self._create_fallback_image(direction_right),
+                owner="Enemy",
             )
-            self.image.set_colorkey((0, 0, 0))  # Make black transparent
 
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -533,6 +539,25 @@ class EnemyProjectile(pygame.sprite.Sprite):
         self.speed = 8
         self.direction_right = direction_right
 
+    def _create_fallback_image(self, direction_right):
+        """Create a simple projectile image if loading fails"""
+        image = pygame.Surface((self.width, self.height))
+        image.fill(self.color)
+        # Add a trail effect
+        trail_color = (255, 255, 255)  # White trail
+        trail_width = self.width // 3
+        if direction_right:
+            trail_x = 0
+        else:
+            trail_x = self.width - trail_width
+        pygame.draw.rect(
+            image,
+            trail_color,
+            (trail_x, self.height // 3, trail_width, self.height // 3),
+        )
+        image.set_colorkey((0, 0, 0))  # Make black transparent
+        return image
+
     def update(self):
         """Move the projectile"""
         if self.direction_right:
@@ -0,0 +1,69 @@
+import pygame
+from .pack import open_asset
+from .manifest import asset_exists
+
+FONTS_DIR = "assets/fonts"
+
+# Every (name, size, bold) font the game draws with, resolved once at startup
+GAME_FONTS = [
+    ("comicsans", 20, False),
+    ("comicsans", 22, False),
+    ("comicsans", 30, False),
+    ("comicsans", 40, False),
+    ("comicsans", 50, False),
+    ("comicsans", 70, False),
+    ("comicsans", 80, True),
+    ("arial", 18, False),
+    ("arial", 24, False),
+    ("arial", 30, False),
+    ("arial", 32, False),
+]
+
+
+class FontRegistry:
+    """Resolves each (name, size, bold) font once and hands out shared Fonts"""
+
+    def __init__(self, fonts_dir=FONTS_DIR):
+        self.fonts_dir = fonts_dir
+        self._fonts = {}
+
+    def get(self, name, size, bold=False):
+        """Return the shared Font for a name, size and weight.
+
+        The Font is shared between callers, so its style must not be changed.
+        """
+        key = (name.lower(), size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._load(*key)
+            self._fonts[key] = font
+        return font
+
+    def preload(self, fonts=GAME_FONTS):
+        """Resolve every font the game uses up front"""
+        for name, size, bold in fonts:
+            self.get(name, size, bold)
+        print(f"Loaded {len(self._fonts)} fonts")
+
+    def _load(self, name, size, bold):
+        # Prefer a bundled TTF so text doesn't depend on the host's fonts
+        path = f"{self.fonts_dir}/{name}.ttf"
+        if asset_exists(path):
+            try:
+                font = pygame.font.Font(open_asset(path), size)
+                font.set_bold(bold)
+                return font
+            except Exception as e:
+                print(f"Error loading font {path}: {e}")
+
+        # Fall back to searching the system fonts
+        return pygame.font.SysFont(name, size, bold=bold)
+
+
+# Shared registry used for all text in the game
+font_registry = FontRegistry()
+
+
+def get_font(name, size, bold=False):
+    """Return the shared Font for a name, size and weight"""
+    return font_registry.get(name, size, bold)
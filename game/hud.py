@@ -0,0 +1,230 @@
+import pygame
+from .fonts import get_font
+from .memory import track
+from .text import draw_text
+
+# Semi-transparent black behind the HUD
+PANEL_COLOR = (0, 0, 0, 160)  # Black with 60% transparency
+TOP_PANEL_HEIGHT = 80
+BOTTOM_PANEL_HEIGHT = 70
+
+# Health bar and mini-map sizes
+HEALTH_WIDTH = 200
+HEALTH_HEIGHT = 20
+MAP_WIDTH = 200
+MAP_HEIGHT = 10
+
+
+class HUD:
+    """Pre-composed HUD panels that only redraw the widgets whose values change"""
+
+    def __init__(self, screen_width, screen_height, title=None, goal_progress=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.font = get_font("comicsans", 30)
+        self.small_font = get_font("comicsans", 20)
+        self.goal_progress = goal_progress
+
+        # Last value each widget was drawn with, and the panel area it covers
+        self._values = {}
+        self._rects = {}
+        self._panel_changed = False
+
+        # Top panel for the score, health, level title and mini-map
+        self.top_panel = pygame.Surface(
+            (screen_width, TOP_PANEL_HEIGHT), pygame.SRCALPHA
+        )
+        track(self.top_panel, "HUD", "top panel")
+        self.top_panel.fill(PANEL_COLOR)
+        if title:
+            self._draw_title(title)
+
+        # Bottom panel with the controls, only shown in regular levels
+        self.bottom_panel = None
+        if goal_progress is not None:
+            self.bottom_panel = self._create_controls_panel()
+
+    def update(self, score, health, max_health, player_progress=None):
+        """Redraw the widgets whose values have changed since the last frame"""
+        self._update_widget("score", score, self._draw_score)
+        self._update_widget("health", (health, max_health), self._draw_health)
+
+        if self.goal_progress is not None:
+            # Only redraw the mini-map when the marker moves a whole pixel
+            marker_x = self._map_x(player_progress)
+            self._update_widget("minimap", marker_x, self._draw_minimap)
+
+    def draw(self, screen):
+        """Blit the HUD panels onto the screen"""
+        if self._panel_changed:
+            # A texture backend has to upload the panel again
+            screen.mark_dirty(self.top_panel)
+            self._panel_changed = False
+
+        blits = [(self.top_panel, (0, 0))]
+        if self.bottom_panel:
+            blits.append(
+                (self.bottom_panel, (0, self.screen_height - BOTTOM_PANEL_HEIGHT))
+            )
+        screen.blits(blits, doreturn=False)
+
+    def _update_widget(self, name, value, draw):
+        if name in self._values and self._values[name] == value:
+            return
+
+        # Clear the widget's old area back to the panel, then draw it again
+        old_rect = self._rects.get(name)
+        if old_rect:
+            self.top_panel.fill(PANEL_COLOR, old_rect)
+        self._rects[name] = draw(value)
+        self._values[name] = value
+        self._panel_changed = True
+
+    def _draw_score(self, score):
+        """Draw the score text"""
+        return draw_text(
+            self.top_panel,
+            f"Score: {score}",
+            self.font,
+            (255, 255, 0),
+            (20, 20),
+            shadow_color=(0, 0, 0),
+            shadow_offset=2,
+        )
+
+    def _draw_health(self, value):
+        """Draw the health bar and health text"""
+        health, max_health = value
+        health_x = self.screen_width - HEALTH_WIDTH - 20
+        health_y = 20
+
+        # Black border around health bar
+        bar_rect = pygame.draw.rect(
+            self.top_panel,
+            (0, 0, 0),
+            (health_x - 2, health_y - 2, HEALTH_WIDTH + 4, HEALTH_HEIGHT + 4),
+        )
+
+        # Background (red)
+        pygame.draw.rect(
+            self.top_panel,
+            (255, 0, 0),
+            (health_x, health_y, HEALTH_WIDTH, HEALTH_HEIGHT),
+        )
+
+        # Foreground (green) - proportional to health
+        health_percent = health / max_health
+        pygame.draw.rect(
+            self.top_panel,
+            (0, 255, 0),
+            (health_x, health_y, int(HEALTH_WIDTH * health_percent), HEALTH_HEIGHT),
+        )
+
+        # Health text with shadow
+        text_rect = draw_text(
+            self.top_panel,
+            f"Health: {health}",
+            self.font,
+            (255, 255, 0),
+            (health_x, health_y + HEALTH_HEIGHT + 5),
+            shadow_color=(0, 0, 0),
+            shadow_offset=2,
+        )
+        return bar_rect.union(text_rect)
+
+    def _draw_title(self, title):
+        """Draw the level title, which never changes"""
+        text_width = self.font.size(title)[0]
+        # Position the title above the top panel to ensure it's above the flag bar
+        text_pos = (self.screen_width // 2 - text_width // 2, 10)
+        draw_text(
+            self.top_panel,
+            title,
+            self.font,
+            (255, 255, 0),
+            text_pos,
+            shadow_color=(0, 0, 0),
+            shadow_offset=2,
+            bg_color=(0, 0, 0),  # Solid backing, so the title reads over any level
+            padding=5,
+            border_radius=4,
+        )
+
+    def _map_x(self, progress):
+        # Position of a progress marker on the mini-map
+        map_x = self.screen_width // 2 - MAP_WIDTH // 2
+        return map_x + int(progress * MAP_WIDTH) - 3
+
+    def _draw_minimap(self, player_map_x):
+        """Draw the mini-map showing progress through the level"""
+        map_x = self.screen_width // 2 - MAP_WIDTH // 2
+        map_y = 50
+
+        # Black border around mini-map
+        map_rect = pygame.draw.rect(
+            self.top_panel,
+            (0, 0, 0),
+            (map_x - 2, map_y - 2, MAP_WIDTH + 4, MAP_HEIGHT + 4),
+        )
+
+        # Background (gray)
+        pygame.draw.rect(
+            self.top_panel, (100, 100, 100), (map_x, map_y, MAP_WIDTH, MAP_HEIGHT)
+        )
+
+        # Player position indicator
+        player_rect = pygame.draw.rect(
+            self.top_panel,
+            (255, 255, 255),
+            (player_map_x, map_y - 2, 6, MAP_HEIGHT + 4),
+        )
+
+        # Goal position indicator
+        goal_rect = pygame.draw.rect(
+            self.top_panel,
+            (255, 215, 0),
+            (self._map_x(self.goal_progress), map_y - 2, 6, MAP_HEIGHT + 4),
+        )
+
+        # Markers at either end stick out past the border
+        return map_rect.unionall([player_rect, goal_rect])
+
+    def _create_controls_panel(self):
+        """Create the bottom panel with the control hints"""
+        panel = pygame.Surface(
+            (self.screen_width, BOTTOM_PANEL_HEIGHT), pygame.SRCALPHA
+        )
+        track(panel, "HUD", "controls panel")
+        panel.fill(PANEL_COLOR)
+
+        # Draw control texts with shadows - spaced more evenly
+        control_y_start = 10
+        line_height = 25
+
+        # Left side controls
+        draw_text(
+            panel,
+            "Press M to toggle music",
+            self.small_font,
+            (200, 200, 255),
+            (20, control_y_start),
+        )
+        draw_text(
+            panel,
+            "A/D to aim ← →, SPACE to shoot",
+            self.small_font,
+            (255, 255, 100),
+            (20, control_y_start + line_height),
+        )
+
+        # Right side controls
+        movement_text = "Arrow keys to move and jump"
+        movement_text_width = self.small_font.size(movement_text)[0]
+        draw_text(
+            panel,
+            movement_text,
+            self.small_font,
+            (255, 200, 200),
+            (self.screen_width - movement_text_width - 20, control_y_start),
+        )
+        return panel
@@ -4,6 +4,32 @@ import math
 from .player import Player
 from .platform import Platform
 from .enemy import Enemy
+from .assets import cached_surface, load_image, normalize_surface
+from .sounds import sound_bank
+from .memory import track
+from .fonts import get_font
+from .hud import HUD
+from .spatial import StaticIndex, BucketIndex
+from .chunks import WorldChunks
+from .parallax import ParallaxBackground, ParallaxLayer
+from .decorations import (
+    TREE_SPACING,
+    VineTile,
+    get_bush_strip,
+    get_cloud_strip,
+    get_shelf_strip,
+    get_sign_strip,
+    get_trunk_strip,
+)
+from .render_queue import RenderQueue, LAYER_ENEMIES, LAYER_PLAYER, LAYER_BULLETS
+
+# How far the shading lines at the top of a hole reach above it
+HOLE_LINE_MARGIN = 6
+
+# Fractions of the camera's speed the far backgrounds and the near scenery
+# in front of them scroll at
+FAR_FACTOR = 0.5
+NEAR_FACTOR = 0.75
 
 
 class Level:
@@ -67,15 +93,19 @@ class Level:
                         cloud_size // 2,
                     )
 
+            self.background_image = normalize_surface(
+                self.background_image, "cloud background"
+            )
+            track(self.background_image, "Level", "cloud background")
             print("Created cloud level background")
 
         elif level_number == 2:  # Jungle level
             try:
-                self.background_image = pygame.image.load(
-                    "assets/images/level_2_background.jpg"
-                ).convert()
-                self.background_image = pygame.transform.scale(
-                    self.background_image, (self.screen_width, self.screen_height)
+                self.background_image = load_image(
+                    "assets/images/level_2_background.jpg",
+                    (self.screen_width, self.screen_height),
+                    alpha=False,
+                    owner="Level",
                 )
                 print("Loaded jungle background image")
             except Exception as e:
@@ -83,11 +113,11 @@ class Level:
 
         elif level_number == 3:  # Supermarket level
             try:
-                self.background_image = pygame.image.load(
-                    "assets/images/level_3_background.jpg"
-                ).convert()
-                self.background_image = pygame.transform.scale(
-                    self.background_image, (self.screen_width, self.screen_height)
+                self.background_image = load_image(
+                    "assets/images/level_3_background.jpg",
+                    (self.screen_width, self.screen_height),
+                    alpha=False,
+                    owner="Level",
                 )
                 print("Loaded supermarket background image")
             except Exception as e:
@@ -124,11 +154,10 @@ class Level:
 
         # Load goal image if available
         try:
-            self.goal_image = pygame.image.load(
-                "assets/images/bottle.png"
-            ).convert_alpha()
-            self.goal_image = pygame.transform.scale(
-                self.goal_image, (self.goal_width, self.goal_height)
+            self.goal_image = load_image(
+                "assets/images/bottle.png",
+                (self.goal_width, self.goal_height),
+                owner="Level",
             )
             print("Loaded bottle.png image as goal!")
         except:
@@ -142,8 +171,27 @@ class Level:
         # Update goal position to be on top of a platform
         self._position_goal_on_platform()
 
+        # Platforms and holes never move, so index them by x once for rendering
+        self.platform_index = StaticIndex(self.platforms)
+        self.hole_index = StaticIndex(self.deadly_holes, get_rect=lambda hole: hole)
+
+        # ...and bake them into chunks, from the highest platform down
+        world_top = min(
+            rect.top for rect in [p.rect for p in self.platforms] + self.deadly_holes
+        )
+        self.world_chunks = WorldChunks(
+            self.level_width,
+            self.screen_width,
+            max(0, world_top - HOLE_LINE_MARGIN),
+            self.level_height,
+            self._draw_static_world,
+        )
+
         # Create enemies
         self.enemies = pygame.sprite.Group()
+        # Enemies and bullets are re-bucketed by x as they move
+        self.enemy_index = BucketIndex()
+        self.bullet_index = BucketIndex()
         self.enemy_spawn_timer = 0
         self.enemy_spawn_delay = (
             96  # Reduced by 20% from 120 (was 2s, now 1.6s at 60 FPS)
@@ -166,18 +214,29 @@ class Level:
             "jungle": (34, 139, 34),  # Forest green
             "supermarket": (220, 220, 220),  # Light gray
         }
+        self.parallax = self._create_parallax()
+
+        # Vines sway on the fallback jungle trunks, redrawn as they move
+        self.vines = None
+        if self.environment == "jungle" and not self.background_image:
+            self.vines = VineTile(self.level_height)
 
         # Level completion requirements - now based on reaching the goal
         self.enemies_to_defeat = 0  # No longer used as completion requirement
 
         # Sound effects
-        try:
-            self.level_complete_sound = pygame.mixer.Sound(
-                "assets/sounds/level_complete.wav"
-            )
-        except:
-            print("Warning: Level complete sound not found")
-            self.level_complete_sound = None
+        self.level_complete_sound = sound_bank.get("level_complete", owner="Level")
+
+        # Sprites are queued during render and blitted a layer at a time
+        self.render_queue = RenderQueue()
+
+        # Retained HUD, redrawn only when the values it shows change
+        self.hud = HUD(
+            self.screen_width,
+            self.screen_height,
+            title=f"Level {self.level_number}: {self.environment.title()}",
+            goal_progress=min(1.0, max(0.0, self.goal_x / self.level_width)),
+        )
 
     def _position_goal_on_platform(self):
         """Places the goal bottle on top of the custom platform at the end of the level"""
@@ -658,6 +717,7 @@ class Level:
         enemy.width = width
         enemy.height = height
         self.enemies.add(enemy)
+        self.enemy_index.move(enemy)
 
         # Log the spawn
         if is_main_enemy:
@@ -732,6 +792,7 @@ class Level:
         player_died = self.player.update(
             self.platforms, self.enemies, self.level_width, self.level_height
         )
+        self.bullet_index.sync(self.player.bullets)
 
         if player_died:
             return False  # Player died - return False
@@ -757,6 +818,7 @@ class Level:
             if enemy.health <= 0 and enemy.alive():
                 enemy.kill()
                 self.score += 100
+        self.enemy_index.sync(self.enemies)
 
         # Check if player reached the goal
         if self.player.rect.colliderect(self.goal_rect):
@@ -786,86 +848,78 @@ class Level:
 
     def _get_screen_position(self, world_x, world_y):
         """Convert world coordinates to screen coordinates"""
-        return world_x - self.camera_x, world_y
+        # Everything uses the same whole-pixel camera offset as the baked
+        # world chunks, so sprites don't jitter against the platforms
+        return world_x - int(self.camera_x), world_y
 
-    def render(self, screen):
-        """Render the level with camera offset"""
-        # Clear screen
-        screen.fill((0, 0, 0))
+    def _draw_static_world(self, surface, offset_x, offset_y):
+        """Draw the platforms and holes that overlap a world chunk"""
+        left = offset_x
+        right = offset_x + surface.get_width()
 
-        # Draw background or use background image
-        if self.background_image:
-            # Create a parallax effect by moving background slower than camera
-            parallax_factor = 0.5
-
-            # Calculate how many background images we need to cover the screen
-            # based on camera position
-            bg_x = -(self.camera_x * parallax_factor)
-            first_bg_x = bg_x % self.screen_width - self.screen_width
-
-            # Draw multiple copies of the background to ensure full coverage
-            for i in range(4):  # Draw up to 4 backgrounds to ensure full coverage
-                x_position = first_bg_x + (i * self.screen_width)
-                if x_position < self.screen_width:  # Only draw if it would be visible
-                    screen.blit(self.background_image, (x_position, 0))
-        else:
-            screen.fill(self.bg_colors.get(self.environment, (0, 0, 0)))
+        # Draw the visible span of each platform
+        for platform in self.platform_index.query(left, right):
+            platform.draw(surface, offset_x, offset_y)
 
-        # Draw environmental details based on level - only if no background image
-        if not self.background_image:
-            self._draw_environment(screen)
+        # Draw holes in the ground (like deep pits)
+        for hole in self.hole_index.query(left, right):
+            hole_x = hole.x - offset_x
+            hole_y = hole.y - offset_y
 
-        # Draw platforms that are visible on screen
-        for platform in self.platforms:
-            # Convert world coordinates to screen coordinates
-            screen_x, screen_y = self._get_screen_position(
-                platform.rect.x, platform.rect.y
+            # Draw a dark pit as the hole
+            hole_color = (10, 10, 10)  # Very dark (almost black) color
+
+            # Draw the main hole
+            pygame.draw.rect(
+                surface,
+                hole_color,
+                pygame.Rect(hole_x, hole_y, hole.width, hole.height),
             )
 
-            # Only draw platforms that are visible on screen
-            if (
-                -platform.rect.width <= screen_x <= self.screen_width
-                and -platform.rect.height <= screen_y <= self.screen_height
-            ):
-                # Create a temporary rect for drawing
-                screen_rect = platform.rect.copy()
-                screen_rect.x = screen_x
-                screen_rect.y = screen_y
+            # Add some depth with a gradient
+            for i in range(3):
+                depth = 5 + (i * 3)  # Increasing line thickness
+                line_y = hole_y + (i * 10)
+                line_color = (20 + (i * 10), 20 + (i * 5), 20)  # Gradually lighter
+                pygame.draw.line(
+                    surface,
+                    line_color,
+                    (hole_x, line_y),
+                    (hole_x + hole.width, line_y),
+                    depth,
+                )
 
-                # Draw the platform
-                screen.blit(platform.image, screen_rect)
+    def _blit_position(self, rect):
+        """Screen position to blit a sprite at"""
+        return self._get_screen_position(rect.x, rect.y)
 
-        # Draw holes in the ground (like deep pits)
-        for hole in self.deadly_holes:
-            hole_screen_x, hole_screen_y = self._get_screen_position(hole.x, hole.y)
+    def _is_visible(self, rect):
+        """Check whether a rect in world coordinates is on screen"""
+        screen_x = rect.x - self.camera_x
+        return (
+            -rect.width <= screen_x <= self.screen_width
+            and -rect.height <= rect.y <= self.screen_height
+        )
 
-            # Only draw if visible on screen
-            if (
-                -hole.width <= hole_screen_x <= self.screen_width
-                and -hole.height <= hole_screen_y <= self.screen_height
-            ):
-                # Draw a dark pit as the hole
-                hole_color = (10, 10, 10)  # Very dark (almost black) color
-
-                # Draw the main hole
-                pygame.draw.rect(
-                    screen,
-                    hole_color,
-                    pygame.Rect(hole_screen_x, hole_screen_y, hole.width, hole.height),
-                )
+    def render(self, screen):
+        """Render the level with camera offset"""
+        # Draw the background layers, filling in behind them if they don't
+        # cover the whole screen
+        if not self.parallax.covers_screen:
+            screen.fill(self.bg_colors.get(self.environment, (0, 0, 0)))
+        self.parallax.draw(screen, self.camera_x)
 
-                # Add some depth with a gradient
-                for i in range(3):
-                    depth = 5 + (i * 3)  # Increasing line thickness
-                    line_y = hole_screen_y + (i * 10)
-                    line_color = (20 + (i * 10), 20 + (i * 5), 20)  # Gradually lighter
-                    pygame.draw.line(
-                        screen,
-                        line_color,
-                        (hole_screen_x, line_y),
-                        (hole_screen_x + hole.width, line_y),
-                        depth,
-                    )
+        # The vines sway, so they're drawn over the background every frame
+        if self.vines is not None:
+            self._draw_vines(screen)
+
+        # Only look at sprites that overlap the camera's view of the level
+        view_left = self.camera_x
+        view_right = self.camera_x + self.screen_width
+        camera_x = int(self.camera_x)
+
+        # Draw the baked platforms and holes
+        self.world_chunks.draw(screen, camera_x)
 
         # Draw goal flag if visible on screen
         goal_screen_x, goal_screen_y = self._get_screen_position(
@@ -877,123 +931,60 @@ class Level:
         ):
             self._draw_goal(screen, goal_screen_x, goal_screen_y)
 
-        # Draw enemies that are visible on screen
-        for enemy in self.enemies:
-            enemy_screen_x, enemy_screen_y = self._get_screen_position(
-                enemy.rect.x, enemy.rect.y
+        # Queue enemies that are visible on screen
+        queue = self.render_queue
+        for enemy in self.enemy_index.query(view_left, view_right):
+            if not self._is_visible(enemy.rect):
+                continue
+            enemy_screen_x, enemy_screen_y = self._blit_position(enemy.rect)
+            queue.add(enemy.image, (enemy_screen_x, enemy_screen_y), LAYER_ENEMIES)
+
+            # Health bar proportional to health
+            max_health = 50 + (enemy.level * 25)
+            if hasattr(enemy, "is_main") and enemy.is_main:
+                max_health *= 2
+            queue.add_health_bar(
+                (enemy_screen_x + (enemy.width - 40) // 2, enemy_screen_y - 8),
+                40,
+                4,
+                max(0, enemy.health / max_health),
+                layer=LAYER_ENEMIES,
             )
 
-            # Only draw enemies that are visible on screen
+            # For main enemies, draw their projectiles if they have any
             if (
-                -enemy.rect.width <= enemy_screen_x <= self.screen_width
-                and -enemy.rect.height <= enemy_screen_y <= self.screen_height
+                hasattr(enemy, "is_main")
+                and enemy.is_main
+                and hasattr(enemy, "projectiles")
             ):
-                # Create a temporary rect for drawing
-                screen_rect = enemy.rect.copy()
-                screen_rect.x = enemy_screen_x
-                screen_rect.y = enemy_screen_y
-
-                # Draw the enemy with health bar
-                screen.blit(enemy.image, screen_rect)
-
-                # Draw health bar
-                health_width = 40
-                health_height = 4
-                health_x = enemy_screen_x + (enemy.width - health_width) // 2
-                health_y = enemy_screen_y - 8
-
-                # Background (red)
-                pygame.draw.rect(
-                    screen,
-                    (255, 0, 0),
-                    (health_x, health_y, health_width, health_height),
-                )
-
-                # Foreground (green) - proportional to health
-                max_health = 50 + (enemy.level * 25)
-                if hasattr(enemy, "is_main") and enemy.is_main:
-                    max_health *= 2
-                health_percent = max(0, enemy.health / max_health)
-                pygame.draw.rect(
-                    screen,
-                    (0, 255, 0),
-                    (
-                        health_x,
-                        health_y,
-                        int(health_width * health_percent),
-                        health_height,
-                    ),
-                )
-
-                # For main enemies, draw their projectiles if they have any
-                if (
-                    hasattr(enemy, "is_main")
-                    and enemy.is_main
-                    and hasattr(enemy, "projectiles")
-                ):
-                    for projectile in enemy.projectiles:
-                        proj_screen_x, proj_screen_y = self._get_screen_position(
-                            projectile.rect.x, projectile.rect.y
+                for projectile in enemy.projectiles:
+                    # Only draw projectiles visible on screen
+                    if self._is_visible(projectile.rect):
+                        queue.add(
+                            projectile.image,
+                            self._blit_position(projectile.rect),
+                            LAYER_ENEMIES,
                         )
 
-                        # Only draw projectiles visible on screen
-                        if (
-                            -projectile.rect.width <= proj_screen_x <= self.screen_width
-                            and -projectile.rect.height
-                            <= proj_screen_y
-                            <= self.screen_height
-                        ):
-                            # Create temporary rect for drawing
-                            proj_screen_rect = projectile.rect.copy()
-                            proj_screen_rect.x = proj_screen_x
-                            proj_screen_rect.y = proj_screen_y
-
-                            # Draw the projectile
-                            screen.blit(projectile.image, proj_screen_rect)
-
-        # Draw player adjusted for camera
-        player_screen_x, player_screen_y = self._get_screen_position(
-            self.player.rect.x, self.player.rect.y
+        # Queue the player adjusted for camera
+        player_screen_x, player_screen_y = self._blit_position(self.player.rect)
+        queue.add(self.player.image, (player_screen_x, player_screen_y), LAYER_PLAYER)
+
+        # Queue player bullets that are visible on screen
+        for bullet in self.bullet_index.query(view_left, view_right):
+            if self._is_visible(bullet.rect):
+                queue.add(bullet.image, self._blit_position(bullet.rect), LAYER_BULLETS)
+
+        # Player health bar
+        queue.add_health_bar(
+            (player_screen_x + (self.player.width - 50) // 2, player_screen_y - 10),
+            50,
+            5,
+            self.player.health / self.player.max_health,
         )
-        screen_rect = self.player.rect.copy()
-        screen_rect.x = player_screen_x
-        screen_rect.y = player_screen_y
-        screen.blit(self.player.image, screen_rect)
-
-        # Draw player bullets adjusted for camera
-        for bullet in self.player.bullets:
-            bullet_screen_x, bullet_screen_y = self._get_screen_position(
-                bullet.rect.x, bullet.rect.y
-            )
 
-            # Only draw bullets that are visible on screen
-            if (
-                -bullet.rect.width <= bullet_screen_x <= self.screen_width
-                and -bullet.rect.height <= bullet_screen_y <= self.screen_height
-            ):
-                screen_rect = bullet.rect.copy()
-                screen_rect.x = bullet_screen_x
-                screen_rect.y = bullet_screen_y
-                screen.blit(bullet.image, screen_rect)
-
-        # Draw player health bar
-        health_width = 50
-        health_height = 5
-        health_x = player_screen_x + (self.player.width - health_width) // 2
-        health_y = player_screen_y - 10
-
-        # Background (red)
-        pygame.draw.rect(
-            screen, (255, 0, 0), (health_x, health_y, health_width, health_height)
-        )
-
-        # Foreground (green) - proportional to health
-        health_percent = self.player.health / self.player.max_health
-        pygame.draw.rect(
-            screen,
-            (0, 255, 0),
-            (health_x, health_y, int(health_width * health_percent), health_height),
-        )
+        # Draw everything queued, a layer at a time
+        queue.flush(screen)
 
         # Draw UI (always positioned relative to screen, not level)
         self._draw_ui(screen)
@@ -1005,323 +996,103 @@ class Level:
             y_offset = math.sin(self.goal_animation_timer / 10) * 5
             screen.blit(self.goal_image, (x, y + y_offset))
         else:
+            screen.blit(self._get_goal_placeholder(), (x, y))
+
+    def _get_goal_placeholder(self):
+        """Return the placeholder bottle drawn when the goal image is missing"""
+
+        def build():
             # Draw placeholder bottle - scaled up to match the larger size
+            surface = pygame.Surface(
+                (self.goal_width, self.goal_height), pygame.SRCALPHA
+            )
             bottle_color = (100, 200, 255)  # Blue bottle
             cap_color = (50, 100, 200)  # Darker blue cap
 
             # Bottle base - large rectangle with rounded corners
-            bottle_rect = pygame.Rect(x, y + 30, self.goal_width, self.goal_height - 40)
-            pygame.draw.rect(screen, bottle_color, bottle_rect, border_radius=20)
+            bottle_rect = pygame.Rect(0, 30, self.goal_width, self.goal_height - 40)
+            pygame.draw.rect(surface, bottle_color, bottle_rect, border_radius=20)
 
             # Bottle neck - narrower at the top
             neck_width = self.goal_width // 3
-            neck_start = x + (self.goal_width - neck_width) // 2
-            pygame.draw.rect(screen, bottle_color, (neck_start, y + 15, neck_width, 20))
+            neck_start = (self.goal_width - neck_width) // 2
+            pygame.draw.rect(surface, bottle_color, (neck_start, 15, neck_width, 20))
 
             # Bottle cap
             cap_width = self.goal_width // 2
-            cap_start = x + (self.goal_width - cap_width) // 2
+            cap_start = (self.goal_width - cap_width) // 2
             pygame.draw.rect(
-                screen, cap_color, (cap_start, y, cap_width, 20), border_radius=5
+                surface, cap_color, (cap_start, 0, cap_width, 20), border_radius=5
             )
 
             # Label text "GOAL"
-            font = pygame.font.SysFont("Arial", 30)
+            font = get_font("Arial", 30)
             text = font.render("GOAL", True, (255, 255, 255))
             text_rect = text.get_rect(
-                center=(x + self.goal_width // 2, y + self.goal_height // 2)
-            )
-            screen.blit(text, text_rect)
-
-    def _draw_environment(self, screen):
-        """Draw environment-specific details with camera offset"""
-        if self.environment == "clouds":
-            # Draw extra clouds
-            for i in range(10):
-                # Clouds move at different speeds for a parallax effect
-                cloud_x = (i * 200 + self.timer // 5) % (self.level_width + 200) - 100
-                cloud_y = 100 + (i % 3) * 100
-
-                # Convert to screen coordinates
-                screen_x, screen_y = self._get_screen_position(cloud_x, cloud_y)
-
-                # Only draw clouds that are visible on screen
-                if (
-                    -200 <= screen_x <= self.screen_width
-                    and -100 <= screen_y <= self.screen_height
-                ):
-                    # Cloud consists of a few overlapping circles
-                    for offset in [(0, 0), (20, -10), (-20, -10), (0, 10)]:
-                        pygame.draw.circle(
-                            screen,
-                            (255, 255, 255),
-                            (screen_x + offset[0], screen_y + offset[1]),
-                            40,
-                        )
-
-        elif self.environment == "jungle":
-            # Draw tree trunks and vines (visible portion only)
-            visible_range = range(
-                max(0, int(self.camera_x // 250) - 1),
-                min(
-                    int((self.camera_x + self.screen_width) // 250) + 2,
-                    int(self.level_width // 250) + 1,
-                ),
+                center=(self.goal_width // 2, self.goal_height // 2)
             )
+            surface.blit(text, text_rect)
+            return surface
 
-            for i in visible_range:
-                x = i * 250
-                screen_x, _ = self._get_screen_position(x, 0)
-
-                # Draw visible tree trunk
-                pygame.draw.rect(
-                    screen, (101, 67, 33), (screen_x, 0, 60, self.level_height)
-                )
-
-                # Vines with screen position adjustment
-                for j in range(3):
-                    vine_x = x + 30 + (j * 10)
-                    screen_vine_x, _ = self._get_screen_position(vine_x, 0)
-
-                    # Calculate vine curve with an offset based on time
-                    end_x = vine_x + 80 * math.sin(self.timer / 100 + j)
-                    screen_end_x, _ = self._get_screen_position(
-                        end_x, self.level_height
-                    )
-
-                    pygame.draw.line(
-                        screen,
-                        (50, 205, 50),
-                        (screen_vine_x, 0),
-                        (screen_end_x, self.level_height),
-                        3,
-                    )
+        return cached_surface(
+            ("goal placeholder", self.goal_width, self.goal_height),
+            build,
+            owner="Level",
+        )
 
+    def _create_parallax(self):
+        """Build the background layers, falling back to drawn scenery without an image"""
+        background = ParallaxBackground(self.screen_width, self.screen_height)
+        if self.background_image:
+            background.add_layer(ParallaxLayer(self.background_image, FAR_FACTOR))
         elif self.environment == "supermarket":
-            # Draw shop shelves and products
-            visible_range = range(
-                max(0, int(self.camera_x // 300) - 1),
-                min(
-                    int((self.camera_x + self.screen_width) // 300) + 2,
-                    int(self.level_width // 300) + 1,
-                ),
-            )
-
-            for i in visible_range:
-                x = i * 300
-                screen_x, _ = self._get_screen_position(x, 0)
-
-                # Shelf structure
-                pygame.draw.rect(
-                    screen,
-                    (169, 169, 169),
-                    (screen_x, 50, 250, self.level_height - 100),
-                )
+            color = self.bg_colors["supermarket"]
+            strip = get_shelf_strip(self.screen_width, self.level_height, color)
+            background.add_layer(ParallaxLayer(strip, FAR_FACTOR))
 
-                # Draw items on shelves
-                for j in range(5):
-                    for k in range(3):
-                        item_x = x + 20 + (j * 40)
-                        item_y = 100 + (k * 150)
-
-                        # Convert to screen coordinates
-                        screen_item_x, screen_item_y = self._get_screen_position(
-                            item_x, item_y
-                        )
+        # Scenery in front of the background, scrolling a little faster
+        if self.environment == "clouds":
+            strip = get_cloud_strip(self.screen_width, self.screen_height // 2)
+            background.add_layer(ParallaxLayer(strip, NEAR_FACTOR))
+        elif self.environment == "jungle":
+            # The bushes stand on the 50 pixel high ground
+            strip = get_bush_strip(self.screen_width)
+            y = self.level_height - 50 - strip.get_height()
+            background.add_layer(ParallaxLayer(strip, NEAR_FACTOR, y))
+        elif self.environment == "supermarket":
+            strip = get_sign_strip(self.screen_width)
+            background.add_layer(ParallaxLayer(strip, NEAR_FACTOR))
+
+        if self.environment == "jungle" and not self.background_image:
+            # The trunks the vines hang from move with the level, over the
+            # plain background colour
+            strip = get_trunk_strip(self.screen_width, self.level_height)
+            background.add_layer(ParallaxLayer(strip, 1.0))
+        return background
+
+    def _draw_vines(self, screen):
+        """Draw the swaying vines on the fallback jungle trunks (visible portion only)"""
+        visible_range = range(
+            max(0, int(self.camera_x // TREE_SPACING) - 1),
+            min(
+                int((self.camera_x + self.screen_width) // TREE_SPACING) + 2,
+                int(self.level_width // TREE_SPACING) + 1,
+            ),
+        )
 
-                        # Only draw items that are visible on screen
-                        if (
-                            -30 <= screen_item_x <= self.screen_width
-                            and -40 <= screen_item_y <= self.screen_height
-                        ):
-                            # Random item colors
-                            color = [
-                                (255, 0, 0),
-                                (0, 255, 0),
-                                (0, 0, 255),
-                                (255, 255, 0),
-                                (255, 0, 255),
-                            ][random.randint(0, 4)]
-                            pygame.draw.rect(
-                                screen, color, (screen_item_x, screen_item_y, 30, 40)
-                            )
+        # Every tree sways together, so they share one frame of the cycle
+        if self.vines.update(self.timer):
+            screen.mark_dirty(self.vines.surface)
+        blits = []
+        for i in visible_range:
+            screen_x, _ = self._get_screen_position(i * TREE_SPACING, 0)
+            blits.append((self.vines.surface, (screen_x + self.vines.left, 0)))
+        screen.blits(blits, doreturn=False)
 
     def _draw_ui(self, screen):
         """Draw UI elements"""
-
-        # Helper function to render text with shadow/outline for better visibility
-        def render_text_with_shadow(
-            text,
-            font,
-            color,
-            position,
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-            bg_color=None,
-        ):
-            # Render shadow
-            shadow_surface = font.render(text, True, shadow_color)
-            shadow_position = (position[0] + shadow_offset, position[1] + shadow_offset)
-
-            # Create text surface
-            text_surface = font.render(text, True, color)
-            text_width, text_height = text_surface.get_size()
-
-            # Create background if requested
-            if bg_color:
-                # Add padding around text
-                padding = 5
-                bg_rect = pygame.Rect(
-                    position[0] - padding,
-                    position[1] - padding,
-                    text_width + padding * 2,
-                    text_height + padding * 2,
-                )
-                pygame.draw.rect(screen, bg_color, bg_rect, border_radius=4)
-
-            # Draw shadow and text
-            screen.blit(shadow_surface, shadow_position)
-            screen.blit(text_surface, position)
-
-            return text_surface
-
-        # Top panel - semi-transparent background for top UI
-        top_panel_height = 80
-        top_panel = pygame.Surface(
-            (self.screen_width, top_panel_height), pygame.SRCALPHA
-        )
-        top_panel.fill((0, 0, 0, 160))  # Black with 60% transparency
-        screen.blit(top_panel, (0, 0))
-
-        # Draw score with shadow
-        font = pygame.font.SysFont("comicsans", 30)
-        score_text = f"Score: {self.score}"
-        render_text_with_shadow(
-            score_text,
-            font,
-            (255, 255, 0),
-            (20, 20),
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-        )
-
-        # Draw health bar background with border
-        health_width = 200
-        health_height = 20
-        health_x = self.screen_width - health_width - 20
-        health_y = 20
-
-        # Black border around health bar
-        pygame.draw.rect(
-            screen,
-            (0, 0, 0),
-            (health_x - 2, health_y - 2, health_width + 4, health_height + 4),
-        )
-
-        # Background (red)
-        pygame.draw.rect(
-            screen, (255, 0, 0), (health_x, health_y, health_width, health_height)
-        )
-
-        # Foreground (green) - proportional to health
-        health_percent = self.player.health / self.player.max_health
-        pygame.draw.rect(
-            screen,
-            (0, 255, 0),
-            (health_x, health_y, int(health_width * health_percent), health_height),
-        )
-
-        # Health text with shadow
-        health_text = f"Health: {self.player.health}"
-        render_text_with_shadow(
-            health_text,
-            font,
-            (255, 255, 0),
-            (health_x, health_y + health_height + 5),
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-        )
-
-        # Draw level info with shadow
-        level_text = f"Level {self.level_number}: {self.environment.title()}"
-        text_width = font.size(level_text)[0]
-        # Position the title above the top panel to ensure it's above the flag bar
-        text_pos = (self.screen_width // 2 - text_width // 2, 10)
-        render_text_with_shadow(
-            level_text,
-            font,
-            (255, 255, 0),
-            text_pos,
-            shadow_color=(0, 0, 0),
-            shadow_offset=2,
-            bg_color=(0, 0, 0, 160),  # Add semi-transparent background
-        )
-
-        # Draw mini-map to show progress through level
-        map_width = 200
-        map_height = 10
-        map_x = self.screen_width // 2 - map_width // 2
-        map_y = 50
-
-        # Black border around mini-map
-        pygame.draw.rect(
-            screen, (0, 0, 0), (map_x - 2, map_y - 2, map_width + 4, map_height + 4)
-        )
-
-        # Background (gray)
-        pygame.draw.rect(screen, (100, 100, 100), (map_x, map_y, map_width, map_height))
-
-        # Player position indicator
         player_progress = min(1.0, max(0.0, self.player.rect.x / self.level_width))
-        player_map_x = map_x + int(player_progress * map_width) - 3
-        pygame.draw.rect(
-            screen, (255, 255, 255), (player_map_x, map_y - 2, 6, map_height + 4)
-        )
-
-        # Goal position indicator
-        goal_progress = min(1.0, max(0.0, self.goal_x / self.level_width))
-        goal_map_x = map_x + int(goal_progress * map_width) - 3
-        pygame.draw.rect(
-            screen, (255, 215, 0), (goal_map_x, map_y - 2, 6, map_height + 4)
-        )
-
-        # Don't draw objective text - removed as requested
-
-        # Bottom UI with controls info in a semi-transparent background panel
-        small_font = pygame.font.SysFont("comicsans", 20)
-
-        # Create a semi-transparent background panel
-        panel_height = 70
-        panel_surface = pygame.Surface(
-            (self.screen_width, panel_height), pygame.SRCALPHA
-        )
-        panel_surface.fill((0, 0, 0, 160))  # Black with 60% transparency
-        screen.blit(panel_surface, (0, self.screen_height - panel_height))
-
-        # Draw control texts with shadows - spaced more evenly
-        control_y_start = self.screen_height - panel_height + 10
-        line_height = 25
-
-        # Left side controls
-        music_text = "Press M to toggle music"
-        render_text_with_shadow(
-            music_text, small_font, (200, 200, 255), (20, control_y_start)
-        )
-
-        shooting_text = "A/D to aim ← →, SPACE to shoot"
-        render_text_with_shadow(
-            shooting_text,
-            small_font,
-            (255, 255, 100),
-            (20, control_y_start + line_height),
-        )
-
-        # Right side controls
-        movement_text = "Arrow keys to move and jump"
-        movement_text_width = small_font.size(movement_text)[0]
-        render_text_with_shadow(
-            movement_text,
-            small_font,
-            (255, 200, 200),
-            (self.screen_width - movement_text_width - 20, control_y_start),
+        self.hud.update(
+            self.score, self.player.health, self.player.max_health, player_progress
         )
+        self.hud.draw(screen)
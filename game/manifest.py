@@ -0,0 +1,95 @@
+import os
+from .pack import asset_pack
+
+# Directories indexed once at startup
+INDEXED_DIRS = ["assets/images", "assets/sounds", "assets/fonts"]
+
+# Every asset the game references, and the fallback used when it's missing
+ASSET_FALLBACKS = {
+    "assets/images/boss_baby.png": "drawn baby placeholder",
+    "assets/images/bullet.png": "red bullet with a yellow trail",
+    "assets/images/platform.png": "solid colour platforms",
+    "assets/images/bottle.png": "drawn blue goal bottle",
+    "assets/images/level_2_background.jpg": "procedural jungle scenery",
+    "assets/images/level_3_background.jpg": "procedural supermarket scenery",
+    "assets/images/background_boss_level.jpg": "dark red background",
+    # Enemies
+    "assets/images/veg_1.png": "coloured vegetable block",
+    "assets/images/veg_2.png": "coloured vegetable block",
+    "assets/images/veg_3.png": "coloured vegetable block",
+    "assets/images/veg_4.png": "coloured vegetable block",
+    "assets/images/veg_5.png": "coloured vegetable block",
+    "assets/images/banana_1.png": "yellow banana block",
+    "assets/images/banana_2.png": "yellow banana block",
+    "assets/images/banana_3.png": "yellow banana block",
+    "assets/images/banana_4.png": "yellow banana block",
+    "assets/images/gran_1.png": "purple grandma block",
+    "assets/images/gran_2.png": "purple grandma block",
+    "assets/images/gran_3.png": "purple grandma block",
+    "assets/images/veg_projectile.png": "green projectile with a white trail",
+    "assets/images/banana_projectile.png": "yellow projectile with a white trail",
+    "assets/images/gran_projectile.png": "purple projectile with a white trail",
+    # Boss level
+    "assets/images/final_boss.png": "red BOSS ellipse",
+    "assets/images/champ_belt.png": "gold CHAMPION badge",
+    # Sounds and music
+    "assets/sounds/select.wav": "silent",
+    "assets/sounds/jump.wav": "silent",
+    "assets/sounds/shoot.wav": "silent",
+    "assets/sounds/hit.wav": "silent",
+    "assets/sounds/enemy_hit.wav": "silent",
+    "assets/sounds/enemy_shoot.wav": "silent",
+    "assets/sounds/level_complete.wav": "silent",
+    "assets/sounds/bg_music.mp3": "no background music",
+    "assets/sounds/boss_music.mp3": "no boss music",
+}
+
+
+class AssetManifest:
+    """Index of which assets exist, built once so hot paths never hit the disk"""
+
+    def __init__(self):
+        self.available = None
+        self._other_paths = {}
+
+    def build(self):
+        """Index the asset directories and the asset pack"""
+        self.available = set(asset_pack.index)
+        for directory in INDEXED_DIRS:
+            if os.path.isdir(directory):
+                for filename in os.listdir(directory):
+                    self.available.add(f"{directory}/{filename}")
+
+        missing = self.missing()
+        print(
+            f"Asset manifest: {len(ASSET_FALLBACKS) - len(missing)} of "
+            f"{len(ASSET_FALLBACKS)} referenced assets found"
+        )
+        for path in missing:
+            print(f"  {path} is missing, using fallback: {ASSET_FALLBACKS[path]}")
+
+    def exists(self, path):
+        """Check whether an asset exists without touching the filesystem"""
+        if self.available is None:
+            self.build()
+
+        if os.path.dirname(path) in INDEXED_DIRS:
+            return path in self.available
+
+        # Paths outside the indexed directories are checked once and remembered
+        if path not in self._other_paths:
+            self._other_paths[path] = os.path.exists(path)
+        return self._other_paths[path]
+
+    def missing(self):
+        """Return the referenced assets that don't exist"""
+        return sorted(path for path in ASSET_FALLBACKS if not self.exists(path))
+
+
+# Shared manifest used by every loader
+asset_manifest = AssetManifest()
+
+
+def asset_exists(path):
+    """Check whether an asset is available in the pack or on disk"""
+    return asset_manifest.exists(path)
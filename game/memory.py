@@ -0,0 +1,146 @@
+import json
+import weakref
+import pygame
+
+MEMORY_REPORT_PATH = "memory_report.json"
+
+
+def surface_bytes(surface):
+    """Return the number of bytes used by a surface's pixel data"""
+    # Subsurfaces share their parent's pixels
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(sound):
+    """Return the number of bytes used by a sound's decoded samples"""
+    # Decoded samples are stored in the mixer's output format
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, size, channels = mixer
+    return int(sound.get_length() * frequency) * (abs(size) // 8) * channels
+
+
+class TrackedObject:
+    """One live surface or sound in the memory registry"""
+
+    def __init__(self, ref, kind, label, size):
+        self.ref = ref
+        self.kind = kind
+        self.label = label
+        self.bytes = size
+        self.owners = set()
+
+
+class MemoryRegistry:
+    """Tracks live surfaces and sounds by owner so their memory can be budgeted.
+
+    Objects are held through weak references and drop out of the totals when
+    they're freed. A shared object counts towards every owner that uses it,
+    but only once towards the overall total.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._owner_bytes = {}
+        self._owner_peaks = {}
+        self.bytes = 0
+        self.peak_bytes = 0
+
+    def track(self, obj, owner, label=""):
+        """Record a surface or sound as used by an owner, and return it"""
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is None or entry.ref() is not obj:
+            if entry is not None:
+                self._forget(key, entry.ref)
+            if isinstance(obj, pygame.mixer.Sound):
+                kind, size = "sound", sound_bytes(obj)
+            else:
+                kind, size = "surface", surface_bytes(obj)
+            ref = weakref.ref(obj, lambda ref, key=key: self._forget(key, ref))
+            entry = TrackedObject(ref, kind, label, size)
+            self._entries[key] = entry
+            self.bytes += size
+            self.peak_bytes = max(self.peak_bytes, self.bytes)
+        elif label and not entry.label:
+            entry.label = label
+
+        if owner not in entry.owners:
+            entry.owners.add(owner)
+            self._add_owner_bytes(owner, entry.bytes)
+        return obj
+
+    def totals(self):
+        """Return the live object count, bytes and peak bytes for each owner"""
+        counts = {}
+        for entry in self._entries.values():
+            for owner in entry.owners:
+                counts[owner] = counts.get(owner, 0) + 1
+
+        return {
+            owner: {
+                "objects": counts.get(owner, 0),
+                "bytes": self._owner_bytes[owner],
+                "peak_bytes": self._owner_peaks[owner],
+            }
+            for owner in sorted(self._owner_bytes)
+        }
+
+    def report(self):
+        """Return the totals plus every live object, largest first"""
+        objects = sorted(
+            self._entries.values(), key=lambda entry: entry.bytes, reverse=True
+        )
+        return {
+            "bytes": self.bytes,
+            "peak_bytes": self.peak_bytes,
+            "owners": self.totals(),
+            "objects": [
+                {
+                    "kind": entry.kind,
+                    "label": entry.label,
+                    "bytes": entry.bytes,
+                    "owners": sorted(entry.owners),
+                }
+                for entry in objects
+            ],
+        }
+
+    def dump(self, path=MEMORY_REPORT_PATH):
+        """Write the memory report to a JSON file"""
+        try:
+            with open(path, "w") as f:
+                json.dump(self.report(), f, indent=2)
+            print(
+                f"Memory report written to {path}: "
+                f"{self.bytes / (1024 * 1024):.1f} MB in {len(self._entries)} objects"
+            )
+        except Exception as e:
+            print(f"Error writing memory report: {e}")
+
+    def _add_owner_bytes(self, owner, size):
+        total = self._owner_bytes.get(owner, 0) + size
+        self._owner_bytes[owner] = total
+        self._owner_peaks[owner] = max(self._owner_peaks.get(owner, 0), total)
+
+    def _forget(self, key, ref):
+        # Called when a tracked object is freed
+        entry = self._entries.get(key)
+        if entry is None or entry.ref is not ref:
+            return
+        del self._entries[key]
+        self.bytes -= entry.bytes
+        for owner in entry.owners:
+            self._add_owner_bytes(owner, -entry.bytes)
+
+
+# Shared registry used by the asset loaders and game objects
+memory_registry = MemoryRegistry()
+
+
+def track(obj, owner, label=""):
+    """Record a surface or sound in the shared memory registry"""
+    return memory_registry.track(obj, owner, label)
@@ -1,6 +1,19 @@
 import pygame
 import random
 import math
+from .assets import cached_surface
+from .sounds import sound_bank
+from .memory import track
+from .fonts import get_font
+from .text import draw_text
+
+TITLE_TEXT = "MUSCLE BABY MAYHEM"
+
+# Space around the title covered by the white oval behind it
+TITLE_OVAL_PADDING = (40, 20)
+
+# Number of distinct title colours the glow animation steps through
+TITLE_GLOW_STEPS = 16
 
 
 class Menu:
@@ -12,10 +25,14 @@ class Menu:
             "Start Game",
             "Instructions",
         ]  # Removed "Quit" from main options
-        self.title_font = pygame.font.SysFont("comicsans", 80, bold=True)
-        self.option_font = pygame.font.SysFont("comicsans", 50)
-        self.description_font = pygame.font.SysFont("comicsans", 30)
-        self.controls_font = pygame.font.SysFont("comicsans", 22)
+        self.title_font = get_font("comicsans", 80, bold=True)
+        self.option_font = get_font("comicsans", 50)
+        self.description_font = get_font("comicsans", 30)
+        self.controls_font = get_font("comicsans", 22)
+
+        # Title size never changes, so measure it once
+        self.title_width, self.title_height = self.title_font.size(TITLE_TEXT)
+        self.title_x = width // 2 - self.title_width // 2
 
         # Variables for quit button highlighting
         self.quit_highlighted = False
@@ -31,9 +48,13 @@ class Menu:
 
         # Show instructions popup flag
         self.show_instructions = False
+        self.popup_drawn = False  # Popup already on screen over the frozen menu
 
         # Background
         self.bg_color = (100, 170, 255)  # Sky blue for cloud theme
+        self.sky = cached_surface(
+            ("menu", "sky", (width, height)), self._create_sky, owner="Menu"
+        )
 
         # Generate cloud positions - ensure they're not near the title
         self.clouds = []
@@ -74,12 +95,8 @@ class Menu:
                 }
             )
 
-        # Load a sample sound for menu selection
-        try:
-            self.select_sound = pygame.mixer.Sound("assets/sounds/select.wav")
-        except:
-            print("Warning: Menu select sound not found")
-            self.select_sound = None
+        # Shared sound for menu selection
+        self.select_sound = sound_bank.get("select", owner="Menu")
 
     def update(self):
         """Update menu animations and handle input"""
@@ -121,6 +138,10 @@ class Menu:
                     pygame.event.post(pygame.event.Event(pygame.QUIT))
                     self.last_key_time = current_time
 
+        # Menu animations pause behind the instructions popup
+        if self.show_instructions:
+            return
+
         # Simple title bounce animation
         self.title_y += self.bounce_direction * self.bounce_speed
         if abs(self.title_y - self.height // 6) >= self.bounce_height:
@@ -198,7 +219,7 @@ class Menu:
                         return "start_game"  # Return "start_game" instead of True
 
             # Check if Quit button was clicked
-            quit_font = pygame.font.SysFont("comicsans", 40)
+            quit_font = get_font("comicsans", 40)
             quit_text = "Quit"
             quit_width = quit_font.size(quit_text)[0] + 20
             quit_height = quit_font.size(quit_text)[1] + 10
@@ -212,7 +233,7 @@ class Menu:
         # Update hover state for quit button
         elif event.type == pygame.MOUSEMOTION:
             # Calculate quit button rect
-            quit_font = pygame.font.SysFont("comicsans", 40)
+            quit_font = get_font("comicsans", 40)
             quit_text = "Quit"
             quit_width = quit_font.size(quit_text)[0] + 20
             quit_height = quit_font.size(quit_text)[1] + 10
@@ -224,131 +245,138 @@ class Menu:
 
         return False  # No option was selected
 
-    def render_text_with_shadow(
-        self,
-        screen,
-        text,
-        font,
-        color,
-        position,
-        shadow_color=(0, 0, 0),
-        shadow_offset=2,
-        bg_color=None,
-    ):
-        """Render text with a shadow for better visibility"""
-        # Create text surface
-        text_surface = font.render(text, True, color)
-        text_width, text_height = text_surface.get_size()
-
-        # Create background if requested
-        if bg_color:
-            # Add padding around text
-            padding = 8
-            bg_rect = pygame.Rect(
-                position[0] - padding,
-                position[1] - padding,
-                text_width + padding * 2,
-                text_height + padding * 2,
-            )
-
-            if isinstance(bg_color, tuple) and len(bg_color) == 4:
-                # Semi-transparent background
-                bg_surface = pygame.Surface(
-                    (bg_rect.width, bg_rect.height), pygame.SRCALPHA
-                )
-                bg_surface.fill(bg_color)
-                screen.blit(bg_surface, (bg_rect.x, bg_rect.y))
-            else:
-                # Solid background
-                pygame.draw.rect(screen, bg_color, bg_rect, border_radius=5)
-
-        # Draw shadow
-        shadow_surface = font.render(text, True, shadow_color)
-        shadow_position = (position[0] + shadow_offset, position[1] + shadow_offset)
-        screen.blit(shadow_surface, shadow_position)
-
-        # Render main text
-        screen.blit(text_surface, position)
-
-        return text_surface
-
-    def render(self, screen):
-        """Render the menu"""
-        # Fill background with gradient sky
+    def _create_sky(self):
+        """Bake the sky gradient background"""
+        sky = pygame.Surface((self.width, self.height))
         for y in range(self.height):
             # Calculate sky color (lighter blue at top, darker at bottom)
             blue_val = max(135, 255 - int(y * 0.5))
             color = (135, 206, blue_val)
-            pygame.draw.line(screen, color, (0, y), (self.width, y))
+            pygame.draw.line(sky, color, (0, y), (self.width, y))
+        return sky
 
-        # Draw animated clouds
-        for cloud in self.clouds:
+    def _get_cloud_sprite(self, size):
+        """Return the shared sprite for a cloud of a given size"""
+
+        def build():
             # Draw several overlapping white circles to create a cloud
-            for offset in [
+            offsets = [
                 (0, 0),
-                (cloud["size"] // 2, -cloud["size"] // 3),
-                (-cloud["size"] // 2, -cloud["size"] // 4),
-                (cloud["size"] // 3, cloud["size"] // 3),
-                (-cloud["size"] // 3, cloud["size"] // 4),
-            ]:
+                (size // 2, -size // 3),
+                (-size // 2, -size // 4),
+                (size // 3, size // 3),
+                (-size // 3, size // 4),
+            ]
+            # The sprite is centred on the cloud position, and no circle
+            # reaches further than the cloud's size from it
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            for offset in offsets:
                 pygame.draw.circle(
-                    screen,
+                    sprite,
                     (255, 255, 255),
-                    (int(cloud["x"] + offset[0]), int(cloud["y"] + offset[1])),
-                    cloud["size"] // 2,
+                    (size + offset[0], size + offset[1]),
+                    size // 2,
                 )
+            return sprite
 
-        # Draw title with shadow - add animated glow effect
-        glow_factor = (math.sin(self.animation_timer / 20) + 1) * 0.5
-        title_color = (
-            int(255),
-            int(20 + glow_factor * 80),
-            int(147 + glow_factor * 50),
-        )
+        return cached_surface(("menu", "cloud", size), build, owner="Menu")
 
-        title_position = (
-            self.width // 2 - self.title_font.size("MUSCLE BABY MAYHEM")[0] // 2,
-            self.title_y,
-        )
+    def _get_panel(self, size, color, border=0):
+        """Return a shared semi-transparent panel of a given size and colour"""
 
-        # Draw larger white oval behind title for better visibility
-        title_width = self.title_font.size("MUSCLE BABY MAYHEM")[0]
-        title_height = self.title_font.size("MUSCLE BABY MAYHEM")[1]
-        pygame.draw.ellipse(
-            screen,
-            (255, 255, 255),
-            (
-                title_position[0] - 40,
-                title_position[1] - 20,
-                title_width + 80,
-                title_height + 40,
-            ),
-            0,  # Filled ellipse
+        def build():
+            panel = pygame.Surface(size, pygame.SRCALPHA)
+            panel.fill(color)
+            if border:
+                pygame.draw.rect(panel, (0, 0, 0), panel.get_rect(), border)
+            return panel
+
+        return cached_surface(
+            ("menu", "panel", size, color, border), build, owner="Menu"
         )
 
-        # Add a slight glow/outline to title
-        glow_size = 3
-        for offset_x in range(-glow_size, glow_size + 1):
-            for offset_y in range(-glow_size, glow_size + 1):
-                if offset_x != 0 or offset_y != 0:  # Skip the center position
-                    glow_pos = (
-                        title_position[0] + offset_x,
-                        title_position[1] + offset_y,
-                    )
-                    shadow_surface = self.title_font.render(
-                        "MUSCLE BABY MAYHEM", True, (255, 100, 180, 50)
-                    )
-                    screen.blit(shadow_surface, glow_pos)
-
-        # Render the title with enhanced visibility
-        self.render_text_with_shadow(
-            screen,
-            "MUSCLE BABY MAYHEM",
-            self.title_font,
-            title_color,
-            title_position,
-            shadow_offset=3,
+    def _glow_step(self):
+        """Return which step of the title glow animation we're on"""
+        glow_factor = (math.sin(self.animation_timer / 20) + 1) * 0.5
+        return round(glow_factor * (TITLE_GLOW_STEPS - 1))
+
+    def _get_title_surface(self, step):
+        """Return the title with its oval and glow for a glow step, composed once"""
+
+        def build():
+            glow_factor = step / (TITLE_GLOW_STEPS - 1)
+            title_color = (
+                int(255),
+                int(20 + glow_factor * 80),
+                int(147 + glow_factor * 50),
+            )
+
+            pad_x, pad_y = TITLE_OVAL_PADDING
+            surface = pygame.Surface(
+                (self.title_width + pad_x * 2, self.title_height + pad_y * 2),
+                pygame.SRCALPHA,
+            )
+
+            # Draw larger white oval behind title for better visibility
+            pygame.draw.ellipse(surface, (255, 255, 255), surface.get_rect(), 0)
+
+            # Add a slight glow/outline to title
+            glow_size = 3
+            glow_surface = self.title_font.render(TITLE_TEXT, True, (255, 100, 180, 50))
+            surface.blits(
+                [
+                    (glow_surface, (pad_x + offset_x, pad_y + offset_y))
+                    for offset_x in range(-glow_size, glow_size + 1)
+                    for offset_y in range(-glow_size, glow_size + 1)
+                    if offset_x != 0 or offset_y != 0  # Skip the center position
+                ],
+                doreturn=False,
+            )
+
+            # Render the title with enhanced visibility
+            shadow_surface = self.title_font.render(TITLE_TEXT, True, (0, 0, 0))
+            text_surface = self.title_font.render(TITLE_TEXT, True, title_color)
+            surface.blit(shadow_surface, (pad_x + 3, pad_y + 3))
+            surface.blit(text_surface, (pad_x, pad_y))
+            return surface
+
+        return cached_surface(("menu", "title", step), build, owner="Menu")
+
+    def render(self, screen):
+        """Render the menu.
+
+        Returns the list of rects that changed, or None if the whole screen did.
+        """
+        # The popup covers a paused menu, so once it's drawn nothing changes
+        if self.show_instructions and self.popup_drawn:
+            return []
+
+        # Pre-rendered sky gradient and cloud sprites
+        blits = [(self.sky, (0, 0))]
+        for cloud in self.clouds:
+            sprite = self._get_cloud_sprite(cloud["size"])
+            blits.append(
+                (
+                    sprite,
+                    (
+                        int(cloud["x"]) - sprite.get_width() // 2,
+                        int(cloud["y"]) - sprite.get_height() // 2,
+                    ),
+                )
+            )
+
+        # Title with its oval and glow, pre-composed for the current glow step
+        title = self._get_title_surface(self._glow_step())
+        blits.append(
+            (
+                title,
+                (
+                    self.title_x - TITLE_OVAL_PADDING[0],
+                    self.title_y - TITLE_OVAL_PADDING[1],
+                ),
+            )
         )
+        screen.blits(blits, doreturn=False)
 
         # Draw subtitle with shadow
         subtitle_position = (
@@ -356,20 +384,22 @@ class Menu:
             - self.description_font.size("The adventures of chungus humungus")[0] // 2,
             self.title_y + 100,
         )
-        self.render_text_with_shadow(
+        draw_text(
             screen,
             "The adventures of chungus humungus",
             self.description_font,
             (100, 50, 150),
             subtitle_position,
             bg_color=(255, 255, 255, 180),
+            padding=8,
         )
 
         # Create a semi-transparent panel for menu options
         panel_height = 270  # Further increased height for better spacing
         panel_y = self.height - panel_height - 20
-        panel = pygame.Surface((self.width // 2, panel_height), pygame.SRCALPHA)
-        panel.fill((0, 0, 0, 120))  # Semi-transparent black
+        panel = self._get_panel(
+            (self.width // 2, panel_height), (0, 0, 0, 120)
+        )  # Semi-transparent black
         panel_x = self.width // 4
         screen.blit(panel, (panel_x, panel_y))
 
@@ -403,8 +433,14 @@ class Menu:
                 option_y,
             )
 
-            self.render_text_with_shadow(
-                screen, option, self.option_font, color, option_pos, bg_color=bg_color
+            draw_text(
+                screen,
+                option,
+                self.option_font,
+                color,
+                option_pos,
+                bg_color=bg_color,
+                padding=8,
             )
 
         # Draw controls instructions - moved further down
@@ -413,18 +449,19 @@ class Menu:
             self.width // 2 - self.description_font.size(instructions)[0] // 2,
             self.height - 70,  # Moved down from -40 to -70
         )
-        self.render_text_with_shadow(
+        draw_text(
             screen,
             instructions,
             self.description_font,
             (0, 0, 0),
             instruction_pos,
             bg_color=(255, 255, 255, 180),
+            padding=8,
         )
 
         # Draw Quit button in bottom right
         quit_text = "Quit"
-        quit_font = pygame.font.SysFont("comicsans", 40)
+        quit_font = get_font("comicsans", 40)
         # Determine button size with padding
         quit_width = quit_font.size(quit_text)[0] + 20
         quit_height = quit_font.size(quit_text)[1] + 10
@@ -436,22 +473,16 @@ class Menu:
             (200, 50, 50, 220) if self.quit_highlighted else (150, 50, 50, 180)
         )
 
-        # Create button background
-        quit_bg = pygame.Surface((quit_width, quit_height), pygame.SRCALPHA)
-        quit_bg.fill(quit_bg_color)
+        # Button background with its border
+        quit_bg = self._get_panel((quit_width, quit_height), quit_bg_color, border=2)
         screen.blit(quit_bg, (quit_x, quit_y))
 
-        # Draw button border
-        pygame.draw.rect(
-            screen, (0, 0, 0), (quit_x, quit_y, quit_width, quit_height), 2
-        )
-
         # Draw quit text
         quit_text_pos = (
             quit_x + (quit_width - quit_font.size(quit_text)[0]) // 2,
             quit_y + (quit_height - quit_font.size(quit_text)[1]) // 2,
         )
-        self.render_text_with_shadow(
+        draw_text(
             screen,
             quit_text,
             quit_font,
@@ -462,11 +493,14 @@ class Menu:
         # Draw instructions popup if enabled
         if self.show_instructions:
             self._render_instructions_popup(screen)
+        self.popup_drawn = self.show_instructions
+        return None
 
     def _render_instructions_popup(self, screen):
         """Render the instructions popup"""
         # Create a semi-transparent overlay
         overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        track(overlay, "Menu", "instructions overlay")
         overlay.fill((0, 0, 0, 180))  # Dark overlay
         screen.blit(overlay, (0, 0))
 
@@ -478,6 +512,7 @@ class Menu:
 
         # Draw popup background
         popup = pygame.Surface((popup_width, popup_height), pygame.SRCALPHA)
+        track(popup, "Menu", "instructions popup")
         popup.fill((220, 240, 255, 230))  # Light blue, semi-transparent
 
         # Draw border
@@ -486,9 +521,7 @@ class Menu:
         # Title
         title = "Game Instructions"
         title_pos = (popup_width // 2 - self.description_font.size(title)[0] // 2, 20)
-        self.render_text_with_shadow(
-            popup, title, self.description_font, (20, 20, 100), title_pos
-        )
+        draw_text(popup, title, self.description_font, (20, 20, 100), title_pos)
 
         # Content sections
         sections = [
@@ -525,7 +558,7 @@ class Menu:
             # Section title
             section_title = section["title"]
             section_pos = (30, y_offset)
-            self.render_text_with_shadow(
+            draw_text(
                 popup, section_title, self.description_font, (50, 50, 150), section_pos
             )
             y_offset += 40
@@ -533,9 +566,7 @@ class Menu:
             # Section content
             for line in section["content"]:
                 line_pos = (60, y_offset)
-                self.render_text_with_shadow(
-                    popup, line, self.controls_font, (50, 50, 50), line_pos
-                )
+                draw_text(popup, line, self.controls_font, (50, 50, 50), line_pos)
                 y_offset += 30
 
             y_offset += 20  # Extra spacing between sections
@@ -558,9 +589,7 @@ class Menu:
             button_x + (button_width - self.controls_font.size(close_text)[0]) // 2,
             button_y + (button_height - self.controls_font.size(close_text)[1]) // 2,
         )
-        self.render_text_with_shadow(
-            popup, close_text, self.controls_font, (255, 255, 255), close_pos
-        )
+        draw_text(popup, close_text, self.controls_font, (255, 255, 255), close_pos)
 
         # Blit popup to screen
         screen.blit(popup, (popup_x, popup_y))
@@ -0,0 +1,97 @@
+import io
+import json
+import mmap
+import os
+import struct
+
+PACK_PATH = "assets.pack"
+
+# Pack header: magic, format version, length of the JSON index that follows
+PACK_MAGIC = b"MBPK"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sII")
+
+
+class PackEntry(io.RawIOBase):
+    """Read-only file-like view of one asset inside the memory-mapped pack"""
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), len(self._view) - self._pos))
+        buffer[:count] = self._view[self._pos : self._pos + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+class AssetPack:
+    """Single memory-mapped file holding every image and sound, with an index"""
+
+    def __init__(self):
+        self.index = {}
+        self._map = None
+
+    def open_pack(self, path=PACK_PATH):
+        """Map a pack file into memory and read its index"""
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, index_length = PACK_HEADER.unpack_from(data)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                print(f"Ignoring asset pack with unknown format: {path}")
+                return False
+
+            index_start = PACK_HEADER.size
+            self.index = json.loads(data[index_start : index_start + index_length])
+            self._map = data
+            print(f"Opened asset pack {path} with {len(self.index)} assets")
+            return True
+        except Exception as e:
+            print(f"Error opening asset pack: {e}")
+            self.index = {}
+            self._map = None
+            return False
+
+    def contains(self, path):
+        """Check whether an asset path is stored in the pack"""
+        return path in self.index
+
+    def open(self, path):
+        """Return a file-like view of a packed asset"""
+        offset, length = self.index[path]
+        return PackEntry(memoryview(self._map)[offset : offset + length])
+
+
+# Shared pack used by the asset loaders, empty until a pack is opened
+asset_pack = AssetPack()
+
+
+def open_asset(path):
+    """Return something pygame can load an asset from: a pack view or the path"""
+    if asset_pack.contains(path):
+        return asset_pack.open(path)
+    return path
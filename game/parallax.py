@@ -0,0 +1,74 @@
+import pygame
+
+
+def compose_strip(period, height, min_width, draw, opaque=True):
+    """Paint a repeating pattern into a strip that wraps around horizontally.
+
+    draw(surface, offset_x) paints one period of the pattern with its left edge
+    at offset_x. The strip repeats it until it's at least min_width wide, so
+    the strip covers the screen in at most two pieces. Opaque strips must be
+    filled by draw(); the rest start out transparent. Strips should be
+    normalized, for example by building them through cached_surface().
+    """
+    width = period * -(-min_width // period)
+    if opaque:
+        strip = pygame.Surface((width, height))
+    else:
+        strip = pygame.Surface((width, height), pygame.SRCALPHA)
+    for offset_x in range(0, width, period):
+        draw(strip, offset_x)
+    return strip
+
+
+class ParallaxLayer:
+    """A wrapped strip that scrolls at a fraction of the camera's speed"""
+
+    def __init__(self, strip, factor, y=0):
+        self.strip = strip
+        self.factor = factor
+        self.y = y
+        self.opaque = (
+            not self.strip.get_flags() & pygame.SRCALPHA
+            and self.strip.get_colorkey() is None
+        )
+
+    def queue(self, blits, camera_x, screen_width):
+        """Add the at most two blits that cover the screen to a blits list"""
+        width, height = self.strip.get_size()
+        # Strip column that lines up with the left edge of the screen
+        left = int(camera_x * self.factor) % width
+        first = min(width - left, screen_width)
+        blits.append((self.strip, (0, self.y), pygame.Rect(left, 0, first, height)))
+        if first < screen_width:
+            rest = pygame.Rect(0, 0, screen_width - first, height)
+            blits.append((self.strip, (first, self.y), rest))
+
+
+class ParallaxBackground:
+    """Draws a stack of parallax layers, back layers first"""
+
+    def __init__(self, screen_width, screen_height, layers=()):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.layers = list(layers)
+
+    def add_layer(self, layer):
+        """Add a layer in front of the existing ones"""
+        self.layers.append(layer)
+
+    @property
+    def covers_screen(self):
+        """Whether an opaque layer hides everything behind the background"""
+        return any(
+            layer.opaque
+            and layer.y <= 0
+            and layer.y + layer.strip.get_height() >= self.screen_height
+            for layer in self.layers
+        )
+
+    def draw(self, screen, camera_x):
+        """Blit every layer for a camera position"""
+        blits = []
+        for layer in self.layers:
+            layer.queue(blits, camera_x, self.screen_width)
+        screen.blits(blits, doreturn=False)
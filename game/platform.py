@@ -1,23 +1,104 @@
 import pygame
 import os
+from .assets import cached_surface, load_image
+from .manifest import asset_exists
+
+PLATFORM_IMAGE = "assets/images/platform.png"
+
+# Platforms are drawn as a left cap, a repeating middle tile and a right cap,
+# so their memory use doesn't grow with their width
+PLATFORM_TILE_WIDTH = 128
+PLATFORM_CAP_WIDTH = 24
+
+
+def _load_platform_slice(part, width, height):
+    """Load one slice of the platform image, scaled to the given size"""
+
+    def build():
+        source = load_image(PLATFORM_IMAGE)
+        quarter = source.get_width() // 4
+
+        # Caps are the outer quarters of the image, the tile is the middle half
+        if part == "left":
+            area = pygame.Rect(0, 0, quarter, source.get_height())
+        elif part == "right":
+            area = pygame.Rect(
+                source.get_width() - quarter, 0, quarter, source.get_height()
+            )
+        else:
+            area = pygame.Rect(quarter, 0, quarter * 2, source.get_height())
+
+        return pygame.transform.scale(source.subsurface(area), (width, height))
+
+    return cached_surface((PLATFORM_IMAGE, part, (width, height)), build, owner="Level")
 
 
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, color=(100, 100, 100)):
         super().__init__()
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = color
 
-        # Try to load platform image
+        # Try to load the platform slices. A missing image was already reported
+        # by the manifest, so those platforms go straight to the solid colour.
+        self.cap_width = min(PLATFORM_CAP_WIDTH, self.rect.width // 2)
+        self.tile = None
+        if not asset_exists(PLATFORM_IMAGE):
+            return
         try:
-            platform_img = pygame.image.load(
-                "assets/images/platform.png"
-            ).convert_alpha()
-            self.image = pygame.transform.scale(platform_img, (width, height))
+            self.left_cap = _load_platform_slice(
+                "left", self.cap_width, self.rect.height
+            )
+            self.right_cap = _load_platform_slice(
+                "right", self.cap_width, self.rect.height
+            )
+            self.tile = _load_platform_slice(
+                "middle", PLATFORM_TILE_WIDTH, self.rect.height
+            )
         except Exception as e:
             # Fallback to colored rectangle if image loading fails
             print(f"Error loading platform image: {e}")
-            self.image = pygame.Surface((width, height))
-            self.image.fill(color)
+            self.tile = None
+
+    def draw(self, surface, offset_x=0, offset_y=0):
+        """Draw the part of the platform that's visible on the surface"""
+        screen_rect = self.rect.move(-offset_x, -offset_y)
+        visible = screen_rect.clip(surface.get_rect())
+        if not visible.width or not visible.height:
+            return
+
+        if self.tile is None:
+            surface.fill(self.color, visible)
+            return
+
+        blits = []
+
+        # End caps, if they're on screen
+        if screen_rect.left + self.cap_width > visible.left:
+            blits.append((self.left_cap, screen_rect.topleft))
+        if screen_rect.right - self.cap_width < visible.right:
+            blits.append(
+                (self.right_cap, (screen_rect.right - self.cap_width, screen_rect.y))
+            )
+
+        # Repeat the middle tile across the visible span only
+        middle_left = screen_rect.left + self.cap_width
+        middle_right = screen_rect.right - self.cap_width
+        start = max(middle_left, visible.left)
+        end = min(middle_right, visible.right)
+        if start < end:
+            skipped_tiles = (start - middle_left) // PLATFORM_TILE_WIDTH
+            x = middle_left + skipped_tiles * PLATFORM_TILE_WIDTH
+            while x < end:
+                # Cut the last tile short at the end of the middle section
+                width = min(PLATFORM_TILE_WIDTH, middle_right - x)
+                blits.append(
+                    (
+                        self.tile,
+                        (x, screen_rect.y),
+                        pygame.Rect(0, 0, width, self.rect.height),
+                    )
+                )
+                x += PLATFORM_TILE_WIDTH
 
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        surface.blits(blits, doreturn=False)
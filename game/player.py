@@ -1,6 +1,8 @@
 import pygame
 import os
 import math
+from .assets import cached_surface, load_facing_images, load_image
+from .sounds import sound_bank
 
 
 class Player(pygame.sprite.Sprite):
@@ -9,61 +11,30 @@ class Player(pygame.sprite.Sprite):
         self.width = 100
         self.height = 120
 
-        # Default image is a placeholder rectangle
-        self.image = pygame.Surface((self.width, self.height))
-        self.image.fill((255, 182, 193))  # Light pink for baby
-
         # Try to load player image
         try:
-            player_img = pygame.image.load(
-                "assets/images/boss_baby.png"
-            ).convert_alpha()
-            self.image = pygame.transform.scale(player_img, (self.width, self.height))
+            self.original_image, self.flipped_image = load_facing_images(
+                "assets/images/boss_baby.png", (self.width, self.height), owner="Player"
+            )
             print("Loaded boss_baby.png image!")
         except Exception as e:
             print(f"Error loading player image: {e}")
-            # Draw a muscly baby placeholder
-            pygame.draw.ellipse(
-                self.image, (255, 200, 200), (0, 0, self.width, self.height * 0.6)
-            )  # Head
-            pygame.draw.rect(
-                self.image,
-                (255, 200, 200),
-                (
-                    self.width * 0.2,
-                    self.height * 0.5,
-                    self.width * 0.6,
-                    self.height * 0.5,
-                ),
-            )  # Body
-            pygame.draw.ellipse(
-                self.image,
-                (200, 100, 100),
-                (
-                    self.width * 0.1,
-                    self.height * 0.4,
-                    self.width * 0.3,
-                    self.height * 0.3,
-                ),
-            )  # Left muscle
-            pygame.draw.ellipse(
-                self.image,
-                (200, 100, 100),
-                (
-                    self.width * 0.6,
-                    self.height * 0.4,
-                    self.width * 0.3,
-                    self.height * 0.3,
-                ),
-            )  # Right muscle
+            # Muscly baby placeholder, drawn once and shared
+            key = ("fallback", "player", (self.width, self.height))
+            self.original_image = cached_surface(
+                key, self._create_fallback_image, owner="Player"
+            )
+            self.flipped_image = cached_surface(
+                key + ("flipped",),
+                lambda: pygame.transform.flip(self.original_image, True, False),
+                owner="Player",
+            )
+        self.image = self.original_image
 
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
-        # Store original image for flipping
-        self.original_image = self.image.copy()
-
         # Movement properties
         self.vel_x = 0
         self.vel_y = 0
@@ -87,16 +58,52 @@ class Player(pygame.sprite.Sprite):
         self.shoot_cooldown = 0
         self.shoot_delay = 15  # Frames between shots
 
-        # Load sound effects
-        try:
-            self.jump_sound = pygame.mixer.Sound("assets/sounds/jump.wav")
-            self.shoot_sound = pygame.mixer.Sound("assets/sounds/shoot.wav")
-            self.hit_sound = pygame.mixer.Sound("assets/sounds/hit.wav")
-        except:
-            print("Warning: Player sound effects not found")
-            self.jump_sound = None
-            self.shoot_sound = None
-            self.hit_sound = None
+        # Shared sound effects from the sound bank
+        self.jump_sound = sound_bank.get("jump", owner="Player")
+        self.shoot_sound = sound_bank.get("shoot", owner="Player")
+        self.hit_sound = sound_bank.get("hit", owner="Player")
+
+    def _create_fallback_image(self):
+        """Create a muscly baby placeholder if loading fails"""
+        # Placeholder rectangle as a base
+        image = pygame.Surface((self.width, self.height))
+        image.fill((255, 182, 193))  # Light pink for baby
+
+        # Draw a muscly baby placeholder
+        pygame.draw.ellipse(
+            image, (255, 200, 200), (0, 0, self.width, self.height * 0.6)
+        )  # Head
+        pygame.draw.rect(
+            image,
+            (255, 200, 200),
+            (
+                self.width * 0.2,
+                self.height * 0.5,
+                self.width * 0.6,
+                self.height * 0.5,
+            ),
+        )  # Body
+        pygame.draw.ellipse(
+            image,
+            (200, 100, 100),
+            (
+                self.width * 0.1,
+                self.height * 0.4,
+                self.width * 0.3,
+                self.height * 0.3,
+            ),
+        )  # Left muscle
+        pygame.draw.ellipse(
+            image,
+            (200, 100, 100),
+            (
+                self.width * 0.6,
+                self.height * 0.4,
+                self.width * 0.3,
+                self.height * 0.3,
+            ),
+        )  # Right muscle
+        return image
 
     def update(self, platforms, enemies, screen_width, screen_height):
         """Update player state"""
@@ -106,10 +113,10 @@ class Player(pygame.sprite.Sprite):
         # Update player orientation based on facing direction
         if self.vel_x < 0 and self.facing_right:  # Moving left
             self.facing_right = False
-            self.image = pygame.transform.flip(self.original_image, True, False)
+            self.image = self.flipped_image
         elif self.vel_x > 0 and not self.facing_right:  # Moving right
             self.facing_right = True
-            self.image = self.original_image.copy()
+            self.image = self.original_image
 
         # Handle shooting cooldown
         if self.shoot_cooldown > 0:
@@ -321,25 +328,27 @@ class Bullet(pygame.sprite.Sprite):
 
         # Try to load bullet image
         try:
-            self.original_image = pygame.image.load(
-                "assets/images/bullet.png"
-            ).convert_alpha()
-            # Scale the image to an appropriate size
-            self.original_image = pygame.transform.scale(self.original_image, (20, 10))
-            self.image = self.original_image
+            # Scaled to an appropriate size and shared between all bullets
+            self.original_image = load_image(
+                "assets/images/bullet.png", (20, 10), owner="Player"
+            )
 
-            # Flip the image if shooting left
-            if not direction_right:
-                self.image = pygame.transform.flip(self.original_image, True, False)
+            # Use the flipped variant if shooting left
+            self.image = load_image(
+                "assets/images/bullet.png",
+                (20, 10),
+                flip=not direction_right,
+                owner="Player",
+            )
 
         except Exception as e:
-            # Fallback to a simple shape if loading fails
-            print(f"Failed to load bullet image: {e}")
-            self.image = pygame.Surface((15, 8))
-            self.image.fill((255, 50, 50))  # Bright red bullet
-            # Add a bullet "trail"
-            pygame.draw.rect(
-                self.image, (255, 255, 0), (0 if direction_right else 10, 2, 5, 4)
+            # Fallback to a simple shape if loading fails, built once per direction.
+            # Python unbinds e after the except block, so keep the message instead.
+            error = str(e)
+            self.image = cached_surface(
+                ("fallback", "bullet", direction_right),
+                lambda: self._create_fallback_image(direction_right, error),
+                owner="Player",
             )
 
         self.rect = self.image.get_rect()
@@ -348,6 +357,15 @@ class Bullet(pygame.sprite.Sprite):
         self.speed = 15  # Increased speed
         self.direction_right = direction_right
 
+    def _create_fallback_image(self, direction_right, error):
+        """Create a simple bullet shape if loading fails"""
+        print(f"Failed to load bullet image: {error}")
+        image = pygame.Surface((15, 8))
+        image.fill((255, 50, 50))  # Bright red bullet
+        # Add a bullet "trail"
+        pygame.draw.rect(image, (255, 255, 0), (0 if direction_right else 10, 2, 5, 4))
+        return image
+
     def update(self):
         """Move the bullet"""
         if self.direction_right:
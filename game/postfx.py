@@ -0,0 +1,194 @@
+import pygame
+from .memory import track
+
+try:
+    import numpy
+except ImportError:
+    # The vignette's mask is built with NumPy; without it the vignette is skipped
+    numpy = None
+
+# Effects run at each quality level, cheapest first
+QUALITY_EFFECTS = {
+    "low": (),
+    "medium": ("flash", "tint"),
+    "high": ("flash", "tint", "vignette"),
+}
+DEFAULT_QUALITY = "high"
+
+# The vignette fades in below this fraction of the player's health
+LOW_HEALTH = 0.3
+# How much the corners are darkened at zero health, and how far from the
+# centre (as a fraction of the way to the corners) the darkening starts
+VIGNETTE_DARKNESS = 0.7
+VIGNETTE_INNER = 0.35
+# Strengths the vignette's mask is rebuilt at as health drops
+VIGNETTE_STEPS = 16
+
+# Frames the screen flashes for when the player is hurt
+FLASH_FRAMES = 8
+FLASH_COLOR = (255, 40, 40)
+FLASH_STRENGTH = 0.4
+
+# Per-channel colour gain and offset the death transition fades into.
+# gain * 255 + offset must stay within 255.
+DEATH_GAIN = (0.8, 0.3, 0.3)
+DEATH_OFFSET = (50, 0, 0)
+
+
+class PostProcess:
+    """Full-screen effects applied in place to the finished frame.
+
+    Effects are blended into the frame with SDL's multiply and add blits,
+    which are far faster than NumPy arithmetic over every pixel. The vignette
+    mask is computed with NumPy straight into its surface's pixels3d view, and
+    only rebuilt when its strength changes. The mask and the colour surface
+    are made once per frame size, so nothing full-screen is allocated while
+    playing, and each effect only runs while it's visible.
+    """
+
+    def __init__(self, quality=DEFAULT_QUALITY):
+        self.quality = None
+        self.effects = ()
+        self.set_quality(quality)
+        self._buffers = {}
+        self.reset()
+
+    @property
+    def enabled(self):
+        """Whether any effects can run"""
+        return bool(self.effects)
+
+    def set_quality(self, quality):
+        """Choose which effects run from a quality level"""
+        if quality not in QUALITY_EFFECTS:
+            print(f"Unknown quality level '{quality}', using '{DEFAULT_QUALITY}'")
+            quality = DEFAULT_QUALITY
+        self.quality = quality
+        self.effects = QUALITY_EFFECTS[quality]
+        if numpy is None and "vignette" in self.effects:
+            print("NumPy not available, low health vignette disabled")
+            self.effects = tuple(e for e in self.effects if e != "vignette")
+
+    def reset(self):
+        """Clear the effects' state, for example when a level starts"""
+        self.health = None
+        self.health_fraction = 1.0
+        self.flash_timer = 0
+        self.death_amount = 0.0
+
+    def track_health(self, health, max_health):
+        """Note the player's health, flashing the screen if it dropped"""
+        if self.health is not None and health < self.health:
+            self.flash_timer = FLASH_FRAMES
+        self.health = health
+        self.health_fraction = health / max_health if max_health else 0.0
+
+    def set_death_amount(self, amount):
+        """Set how far the death tint has faded in, from 0 to 1"""
+        self.death_amount = min(1.0, max(0.0, amount))
+
+    def apply(self, surface):
+        """Run the active effects on a frame and advance their timers"""
+        if surface is None or not self.enabled:
+            return
+
+        flash = 0.0
+        if self.flash_timer > 0 and "flash" in self.effects:
+            flash = FLASH_STRENGTH * self.flash_timer / FLASH_FRAMES
+        self.flash_timer = max(0, self.flash_timer - 1)
+
+        tint = self.death_amount if "tint" in self.effects else 0.0
+
+        vignette = 0
+        if self.health_fraction < LOW_HEALTH and "vignette" in self.effects:
+            amount = 1 - max(0.0, self.health_fraction) / LOW_HEALTH
+            vignette = max(1, round(amount * VIGNETTE_STEPS))
+
+        if not (flash or tint or vignette):
+            return
+
+        buffers = self._get_buffers(surface)
+        if vignette:
+            surface.blit(
+                buffers.get_vignette(vignette), (0, 0), None, pygame.BLEND_RGB_MULT
+            )
+        if flash or tint:
+            gain, offset = _grade(flash, tint)
+            color = buffers.color
+            color.fill(gain)
+            surface.blit(color, (0, 0), None, pygame.BLEND_RGB_MULT)
+            if any(offset):
+                color.fill(offset)
+                surface.blit(color, (0, 0), None, pygame.BLEND_RGB_ADD)
+
+    def _get_buffers(self, surface):
+        size = surface.get_size()
+        buffers = self._buffers.get(size)
+        if buffers is None:
+            buffers = self._buffers[size] = EffectBuffers(size, surface)
+        return buffers
+
+
+class EffectBuffers:
+    """Surfaces the effects blend into a frame of one size"""
+
+    def __init__(self, size, frame):
+        # Surfaces in the frame's format blend without converting pixels
+        self.color = track(pygame.Surface(size, 0, frame), "Render", "effect color")
+        self.vignette = None
+        self.vignette_step = None
+        self._falloff = None
+        self._scaled = None
+        self._mask = None
+
+    def get_vignette(self, step):
+        """Return the vignette mask for a strength from 1 to VIGNETTE_STEPS"""
+        if self.vignette is None:
+            # Arrays are laid out row by row like the surface's pixels, and
+            # transposed to the (x, y) indexing of its pixels3d view
+            width, height = self.color.get_size()
+            x = numpy.linspace(-1.0, 1.0, width)[None, :]
+            y = numpy.linspace(-1.0, 1.0, height)[:, None]
+            distance = numpy.sqrt(x * x + y * y) / numpy.sqrt(2.0)
+            amount = numpy.clip(
+                (distance - VIGNETTE_INNER) / (1 - VIGNETTE_INNER), 0, 1
+            )
+            # Darkening out of 255 at full strength, and room to scale it
+            falloff = numpy.round(amount * amount * VIGNETTE_DARKNESS * 255)
+            self._falloff = falloff.astype(numpy.uint16).T
+            self._scaled = numpy.empty_like(self._falloff)
+            self._mask = numpy.empty_like(self._falloff, numpy.uint8)
+            self.vignette = track(self.color.copy(), "Render", "vignette")
+
+        if step != self.vignette_step:
+            numpy.multiply(self._falloff, step, out=self._scaled)
+            numpy.floor_divide(self._scaled, VIGNETTE_STEPS, out=self._scaled)
+            numpy.subtract(255, self._scaled, out=self._mask, casting="unsafe")
+
+            # Write the mask in place through a view of the surface's pixels,
+            # a channel at a time, which is much faster than broadcasting
+            pixels = pygame.surfarray.pixels3d(self.vignette)
+            for channel in range(3):
+                pixels[:, :, channel] = self._mask
+            # Release the view so the surface is unlocked for blitting
+            del pixels
+            self.vignette_step = step
+        return self.vignette
+
+
+def _grade(flash, tint):
+    # Colours to multiply then add the frame by for the flash and death tint
+    gain = [1.0, 1.0, 1.0]
+    offset = [0.0, 0.0, 0.0]
+    if tint:
+        for c in range(3):
+            gain[c] = 1 + (DEATH_GAIN[c] - 1) * tint
+            offset[c] = DEATH_OFFSET[c] * tint
+    if flash:
+        # Blend the graded colour towards the flash colour
+        for c in range(3):
+            gain[c] *= 1 - flash
+            offset[c] = offset[c] * (1 - flash) + FLASH_COLOR[c] * flash
+    gain = tuple(round(g * 255) for g in gain)
+    offset = tuple(round(o) for o in offset)
+    return gain, offset
@@ -0,0 +1,71 @@
+import pygame
+from .assets import cached_surface
+
+# Draw layers, from back to front
+LAYER_WORLD = 0
+LAYER_ENEMIES = 1
+LAYER_PLAYER = 2
+LAYER_BULLETS = 3
+LAYER_BOSS = 4  # The boss is drawn over the player
+LAYER_OVERLAY = 5
+
+
+def health_bar_segments(width, height, back_color, fill_color, border=0):
+    """Return the cached background and fill surfaces for a health bar size.
+
+    A bar is drawn as the whole background plus the left part of the fill.
+    """
+
+    def build(color):
+        bar = pygame.Surface((width, height))
+        bar.fill(color)
+        if border:
+            pygame.draw.rect(bar, (0, 0, 0), bar.get_rect(), border)
+        return bar
+
+    key = ("health bar", width, height, border)
+    back = cached_surface(key + (back_color,), lambda: build(back_color), "Level")
+    fill = cached_surface(key + (fill_color,), lambda: build(fill_color), "Level")
+    return back, fill
+
+
+class RenderQueue:
+    """Collects a frame's blits by layer and submits each layer in one blits call"""
+
+    def __init__(self):
+        self._layers = {}
+
+    def add(self, surface, position, layer=LAYER_WORLD, area=None):
+        """Queue a surface to be blitted at a screen position"""
+        entries = self._layers.setdefault(layer, [])
+        if area is None:
+            entries.append((surface, position))
+        else:
+            entries.append((surface, position, area))
+
+    def add_health_bar(
+        self,
+        position,
+        width,
+        height,
+        percent,
+        back_color=(255, 0, 0),
+        fill_color=(0, 255, 0),
+        border=0,
+        layer=LAYER_OVERLAY,
+    ):
+        """Queue a health bar filled to a fraction of its width"""
+        back, fill = health_bar_segments(width, height, back_color, fill_color, border)
+        self.add(back, position, layer)
+
+        filled = int(width * percent)
+        if filled > 0:
+            self.add(fill, position, layer, pygame.Rect(0, 0, filled, height))
+
+    def flush(self, screen):
+        """Blit everything queued this frame, back layers first, and empty the queue"""
+        for layer in sorted(self._layers):
+            entries = self._layers[layer]
+            if entries:
+                screen.blits(entries, doreturn=False)
+                entries.clear()
@@ -0,0 +1,62 @@
+import os
+import pygame
+from .pack import open_asset
+from .manifest import asset_exists
+from .memory import sound_bytes, track
+
+SOUNDS_DIR = "assets/sounds"
+
+
+class SoundBank:
+    """Decodes each sound file once and hands out shared Sound objects by name"""
+
+    def __init__(self, sounds_dir=SOUNDS_DIR):
+        self.sounds_dir = sounds_dir
+        self._sounds = {}
+        self._sizes = {}
+
+    def get(self, name, owner=None):
+        """Return the shared Sound for a name like "jump" or "boss_music.mp3".
+
+        Returns None if the sound can't be loaded. Failed loads are remembered
+        so missing files are only tried once. If an owner is given the sound is
+        counted towards it in the memory registry.
+        """
+        if name not in self._sounds:
+            # Mixer not ready yet, so don't remember this as a failure
+            if not pygame.mixer.get_init():
+                return None
+            self._sounds[name] = self._load(name)
+
+        sound = self._sounds[name]
+        if sound is not None and owner is not None:
+            track(sound, owner)
+        return sound
+
+    def _load(self, name):
+        # Decode a sound file, or return None if it's missing or unreadable
+        filename = name if os.path.splitext(name)[1] else f"{name}.wav"
+        path = f"{self.sounds_dir}/{filename}"
+
+        # Missing sounds are already reported by the manifest and stay silent
+        sound = None
+        if asset_exists(path):
+            try:
+                sound = pygame.mixer.Sound(open_asset(path))
+                self._sizes[name] = sound_bytes(sound)
+                track(sound, "Sounds", path)
+            except Exception as e:
+                print(f"Warning: Sound {filename} could not be loaded: {e}")
+        return sound
+
+    def memory_report(self):
+        """Return the decoded size in bytes of each loaded sound"""
+        return dict(self._sizes)
+
+    def total_bytes(self):
+        """Return the decoded size in bytes of every loaded sound"""
+        return sum(self._sizes.values())
+
+
+# Shared sound bank used by every game object
+sound_bank = SoundBank()
@@ -0,0 +1,85 @@
+import bisect
+
+# Width of the x buckets moving sprites are sorted into
+BUCKET_WIDTH = 256
+
+
+class StaticIndex:
+    """X-sorted index of objects that never move, for finding what's on screen"""
+
+    def __init__(self, items, get_rect=lambda item: item.rect):
+        # Sort by left edge so a range query is two bisects
+        entries = sorted(
+            ((get_rect(item), item) for item in items), key=lambda e: e[0].left
+        )
+        self._lefts = [rect.left for rect, _ in entries]
+        self._entries = entries
+        self._max_width = max((rect.width for rect, _ in entries), default=0)
+
+    def query(self, left, right):
+        """Return the objects whose x span touches [left, right], in x order"""
+        # Nothing wider than the widest object can start further left than this
+        start = bisect.bisect_left(self._lefts, left - self._max_width)
+        end = bisect.bisect_right(self._lefts, right)
+        return [item for rect, item in self._entries[start:end] if rect.right >= left]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class BucketIndex:
+    """Sorts moving sprites into fixed-width x buckets to find visible ones cheaply"""
+
+    def __init__(self, bucket_width=BUCKET_WIDTH):
+        self.bucket_width = bucket_width
+        self._buckets = {}
+        self._spans = {}
+
+    def move(self, sprite):
+        """Update a sprite's buckets after it moves"""
+        span = (
+            sprite.rect.left // self.bucket_width,
+            sprite.rect.right // self.bucket_width,
+        )
+        old_span = self._spans.get(sprite)
+        if span == old_span:
+            return
+
+        if old_span:
+            self._unbucket(sprite, old_span)
+        for bucket in range(span[0], span[1] + 1):
+            # Dicts keep sprites in the order they were added, so overlapping
+            # sprites keep drawing in the same order
+            self._buckets.setdefault(bucket, {})[sprite] = None
+        self._spans[sprite] = span
+
+    def remove(self, sprite):
+        """Stop tracking a sprite"""
+        span = self._spans.pop(sprite, None)
+        if span:
+            self._unbucket(sprite, span)
+
+    def sync(self, sprites):
+        """Update every sprite in a group and drop the ones that were killed"""
+        for sprite in sprites:
+            self.move(sprite)
+        for sprite in [s for s in self._spans if not s.alive()]:
+            self.remove(sprite)
+
+    def query(self, left, right):
+        """Return the sprites in the buckets touching [left, right]"""
+        found = {}
+        for bucket in range(
+            int(left) // self.bucket_width, int(right) // self.bucket_width + 1
+        ):
+            sprites = self._buckets.get(bucket)
+            if sprites:
+                found.update(sprites)
+        return list(found)
+
+    def _unbucket(self, sprite, span):
+        for bucket in range(span[0], span[1] + 1):
+            sprites = self._buckets[bucket]
+            del sprites[sprite]
+            if not sprites:
+                del self._buckets[bucket]
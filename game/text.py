@@ -0,0 +1,134 @@
+import pygame
+from collections import OrderedDict
+from .memory import track
+
+# Most labels kept rendered at once
+TEXT_CACHE_SIZE = 256
+
+
+class TextCache:
+    """LRU cache of text labels with their shadow and background composited in"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+        # Runtime counters
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached label for a key, or None if it isn't cached"""
+        label = self._entries.get(key)
+        if label is None:
+            self.misses += 1
+            return None
+
+        # Mark as most recently used
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return label
+
+    def put(self, key, label):
+        """Store a label, dropping the least recently used one if full"""
+        self._entries[key] = label
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached label"""
+        self._entries.clear()
+
+    def stats(self):
+        """Return a snapshot of the cache counters"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared cache used by every text label in the game
+text_cache = TextCache()
+
+
+def render_label(
+    text,
+    font,
+    color,
+    shadow_color=(0, 0, 0),
+    shadow_offset=2,
+    bg_color=None,
+    padding=10,
+    border_radius=0,
+):
+    """Render text with a drop shadow and optional background into one surface.
+
+    The label is cached and shared, so it must not be drawn on. The text
+    starts at (padding, padding) in the label if it has a background, or at
+    (0, 0) if it doesn't. An RGB background is solid and an RGBA one is
+    blended with whatever the label is drawn over.
+    """
+    key = (
+        text,
+        font,
+        color,
+        shadow_color,
+        shadow_offset,
+        bg_color,
+        padding,
+        border_radius,
+    )
+    label = text_cache.get(key)
+    if label is not None:
+        return label
+
+    text_surface = font.render(text, True, color)
+    shadow_surface = font.render(text, True, shadow_color)
+    text_width, text_height = text_surface.get_size()
+
+    if bg_color:
+        # Background with padding around the text
+        size = (text_width + padding * 2, text_height + padding * 2)
+        origin = (padding, padding)
+    else:
+        size = (text_width + shadow_offset, text_height + shadow_offset)
+        origin = (0, 0)
+
+    label = pygame.Surface(size, pygame.SRCALPHA)
+    if bg_color:
+        pygame.draw.rect(label, bg_color, label.get_rect(), border_radius=border_radius)
+
+    # Shadow first, then the text on top
+    label.blit(shadow_surface, (origin[0] + shadow_offset, origin[1] + shadow_offset))
+    label.blit(text_surface, origin)
+
+    track(label, "Text", text)
+    text_cache.put(key, label)
+    return label
+
+
+def draw_text(
+    surface,
+    text,
+    font,
+    color,
+    position,
+    shadow_color=(0, 0, 0),
+    shadow_offset=2,
+    bg_color=None,
+    padding=10,
+    border_radius=0,
+):
+    """Draw a cached text label with its text at the given position.
+
+    Returns the rect that was drawn.
+    """
+    label = render_label(
+        text, font, color, shadow_color, shadow_offset, bg_color, padding, border_radius
+    )
+    if bg_color:
+        position = (position[0] - padding, position[1] - padding)
+    return surface.blit(label, position)
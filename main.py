@@ -2,10 +2,20 @@ import pygame
 import sys
 import os
 import math
+import time
 from game.player import Player
 from game.level import Level
 from game.menu import Menu
 from game.boss_level import BossLevel
+from game.atlas import sprite_atlas
+from game.backend import create_backend, ResolutionScaler
+from game.postfx import PostProcess
+from game.sounds import sound_bank
+from game.pack import asset_pack, open_asset
+from game.manifest import asset_manifest, asset_exists
+from game.memory import memory_registry, track
+from game.fonts import font_registry, get_font
+from game.text import draw_text
 
 # Initialize pygame
 pygame.init()
@@ -17,11 +27,59 @@ SCREEN_HEIGHT = 800
 TITLE = "Muscle Baby Mayhem"
 FPS = 60
 
-# Create the screen
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption(TITLE)
+# Only present the parts of the screen each state reports as changed
+DIRTY_RECTS = True
+
+# Draw with CPU blits by default, or through GPU textures with --texture
+RENDER_BACKEND = "texture" if "--texture" in sys.argv else "software"
+
+# Render at a fraction of the screen resolution and scale up with --scale=0.75,
+# or pick the resolution from the frame time with --scale=auto
+RENDER_SCALE = None
+for arg in sys.argv:
+    if arg.startswith("--scale="):
+        RENDER_SCALE = arg.split("=", 1)[1]
+if RENDER_SCALE and RENDER_BACKEND == "software":
+    RENDER_BACKEND = "scaled"
+
+# Full-screen effects to run during play: --quality=low skips them all,
+# --quality=medium skips only the low health vignette
+QUALITY = "high"
+for arg in sys.argv:
+    if arg.startswith("--quality="):
+        QUALITY = arg.split("=", 1)[1]
+
+# Create the screen. Everything draws through the backend's shared interface.
+screen = create_backend(
+    RENDER_BACKEND,
+    (SCREEN_WIDTH, SCREEN_HEIGHT),
+    TITLE,
+    scale=1.0 if RENDER_SCALE in (None, "auto") else float(RENDER_SCALE),
+)
 clock = pygame.time.Clock()
 
+# Lower the render resolution when frames take longer than the frame budget
+resolution_scaler = None
+if RENDER_SCALE == "auto" and screen.name == "scaled":
+    resolution_scaler = ResolutionScaler(screen, 1000 / FPS)
+
+# Hit flashes, low health vignette and death tint, applied after levels render
+post_process = PostProcess(QUALITY)
+if post_process.enabled and screen.target is None:
+    print("Post-processing needs the frame's pixels, skipped with this backend")
+
+# Map the single-file asset pack if one has been built
+asset_pack.open_pack()
+
+# Index which assets exist once, reporting any missing ones and their fallbacks
+asset_manifest.build()
+
+# Resolve every font once instead of searching the system fonts while drawing
+font_registry.preload()
+
+# Decode the sprite atlas once up front instead of during play
+sprite_atlas.load()
+
 # Game states
 MENU = 0
 PLAYING = 1
@@ -29,53 +87,13 @@ GAME_OVER = 2
 LEVEL_COMPLETE = 3
 PLAYER_DIED = 4  # New state for player death
 BOSS_LEVEL = 5  # New state for boss level
+PLAYER_DYING = 6  # The death tint fades in before the death screen
 
+# Frames the death tint takes to fade in
+DEATH_TRANSITION_FRAMES = 45
 
-# Helper function to render text with shadow and optional background
-def render_text_with_shadow(
-    screen,
-    text,
-    font,
-    color,
-    position,
-    shadow_color=(0, 0, 0),
-    shadow_offset=2,
-    bg_color=None,
-):
-    # Create text surface
-    text_surface = font.render(text, True, color)
-    text_width, text_height = text_surface.get_size()
-
-    # Create background if requested
-    if bg_color:
-        # Add padding around text
-        padding = 10
-        bg_rect = pygame.Rect(
-            position[0] - padding,
-            position[1] - padding,
-            text_width + padding * 2,
-            text_height + padding * 2,
-        )
-        if isinstance(bg_color, tuple) and len(bg_color) == 4:
-            # Semi-transparent background
-            bg_surface = pygame.Surface(
-                (bg_rect.width, bg_rect.height), pygame.SRCALPHA
-            )
-            bg_surface.fill(bg_color)
-            screen.blit(bg_surface, (bg_rect.x, bg_rect.y))
-        else:
-            # Solid background
-            pygame.draw.rect(screen, bg_color, bg_rect, border_radius=5)
-
-    # Render shadow
-    shadow_surface = font.render(text, True, shadow_color)
-    shadow_position = (position[0] + shadow_offset, position[1] + shadow_offset)
-    screen.blit(shadow_surface, shadow_position)
-
-    # Render main text
-    screen.blit(text_surface, position)
-
-    return text_surface
+# States whose screen doesn't change while they're showing
+STATIC_SCREENS = (LEVEL_COMPLETE, PLAYER_DIED, GAME_OVER)
 
 
 class Game:
@@ -116,27 +134,38 @@ class Game:
         # To store the selected death message
         self.current_death_message = ""
 
+        # Frames left of the death transition
+        self.death_timer = 0
+
+        # Composed static screen and the key it was composed for
+        self.static_screen = None
+        self.static_screen_key = None
+
+        # Present the whole screen on the next frame, e.g. after the window is exposed
+        self.full_present = True
+
         # Sound for death
-        try:
-            self.death_sound = pygame.mixer.Sound("assets/sounds/hit.wav")
-        except:
-            self.death_sound = None
-
-        # Background music
-        try:
-            pygame.mixer.music.load("assets/sounds/bg_music.mp3")
-            pygame.mixer.music.set_volume(0.5)  # 50% volume
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-            self.music_playing = True
-            print("Background music loaded and playing")
-        except Exception as e:
-            print(f"Error loading background music: {e}")
-            self.music_playing = False
+        self.death_sound = sound_bank.get("hit", owner="Player")
+
+        # Background music (a missing file was already reported by the manifest)
+        self.music_playing = False
+        if asset_exists("assets/sounds/bg_music.mp3"):
+            try:
+                pygame.mixer.music.load(
+                    open_asset("assets/sounds/bg_music.mp3"), "bg_music.mp3"
+                )
+                pygame.mixer.music.set_volume(0.5)  # 50% volume
+                pygame.mixer.music.play(-1)  # Loop indefinitely
+                self.music_playing = True
+                print("Background music loaded and playing")
+            except Exception as e:
+                print(f"Error loading background music: {e}")
 
     def start_level(self, level_number):
         """Start a new level"""
         global screen
         self.current_level = level_number
+        post_process.reset()
 
         # Check if this is the boss level
         if level_number > self.max_levels:
@@ -215,6 +244,19 @@ class Game:
             # Prepare for next level
             self.current_level += 1
 
+    def start_dying(self):
+        """Fade in the death tint over the stopped level, then show the death screen"""
+        # Play death sound
+        if self.death_sound:
+            self.death_sound.play()
+
+        # Without the tint there's nothing to wait for
+        if "tint" not in post_process.effects or screen.target is None:
+            self.player_died()
+            return
+        self.state = PLAYER_DYING
+        self.death_timer = DEATH_TRANSITION_FRAMES
+
     def player_died(self):
         """Handle player death"""
         self.state = PLAYER_DIED
@@ -222,10 +264,6 @@ class Game:
         # Save player's health state (which will be 0)
         self.player_health = 0
 
-        # Play death sound
-        if self.death_sound:
-            self.death_sound.play()
-
         # Select a random death message for the current level
         import random
 
@@ -265,20 +303,290 @@ class Game:
         print("Congratulations! You've completed the game and defeated the boss!")
         self.state = GAME_OVER
 
+    def _post_process(self, player):
+        """Run the full-screen effects over the frame a level just drew"""
+        post_process.track_health(player.health, player.max_health)
+        post_process.apply(screen.target)
+
+    def _static_screen_key(self):
+        """Return what the current static screen depends on"""
+        if self.state == LEVEL_COMPLETE:
+            return (self.state, self.current_level, self.score)
+        if self.state == PLAYER_DIED:
+            return (
+                self.state,
+                self.current_death_message,
+                self.score + self.level.score,
+            )
+        return (self.state, None, self.score)
+
+    def _render_static_screen(self):
+        """Draw the current static screen, composing it over the last frame once.
+
+        Returns the list of rects that changed, which is empty once it's shown.
+        """
+        key = self._static_screen_key()
+        if key == self.static_screen_key:
+            # Already on screen
+            return []
+
+        # Darken a snapshot of the last frame once, instead of every frame
+        self.static_screen = track(screen.copy(), "HUD", "static screen")
+        if self.state == LEVEL_COMPLETE:
+            self._draw_level_complete_screen(self.static_screen)
+        elif self.state == PLAYER_DIED:
+            self._draw_death_screen(self.static_screen)
+        else:
+            self._draw_game_over_screen(self.static_screen)
+        self.static_screen_key = key
+
+        screen.blit(self.static_screen, (0, 0))
+        return [screen.get_rect()]
+
+    def _draw_level_complete_screen(self, surface):
+        """Draw the level complete overlay and messages"""
+        # Create a semi-transparent overlay
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        track(overlay, "HUD", "level complete overlay")
+        overlay.fill((0, 0, 0, 180))  # Black with 70% transparency
+        surface.blit(overlay, (0, 0))
+
+        # Show level complete screen
+        font = get_font("comicsans", 70)
+        level_complete_text = f"Level {self.current_level - 1} Complete!"
+
+        # Draw title with background
+        title_y = SCREEN_HEIGHT // 3
+        draw_text(
+            surface,
+            level_complete_text,
+            font,
+            (255, 255, 0),
+            (
+                SCREEN_WIDTH // 2 - font.size(level_complete_text)[0] // 2,
+                title_y,
+            ),
+            shadow_offset=3,
+            bg_color=(50, 50, 100, 180),
+        )
+
+        # Show funny completion message
+        messages = {
+            1: "Those veggies got SERVED!",
+            2: "Bananas? More like SPLIT!",
+            3: "Grandmas sent back to bingo night!",
+        }
+
+        message_text = messages.get(self.current_level - 1, "")
+        font = get_font("comicsans", 40)
+
+        # Draw message with background
+        message_y = title_y + 120
+        draw_text(
+            surface,
+            message_text,
+            font,
+            (255, 255, 255),
+            (SCREEN_WIDTH // 2 - font.size(message_text)[0] // 2, message_y),
+            bg_color=(50, 100, 50, 160),
+        )
+
+        # Continue prompt
+        prompt_text = "Press ENTER to continue..."
+        prompt_y = message_y + 100
+        draw_text(
+            surface,
+            prompt_text,
+            font,
+            (200, 200, 200),
+            (SCREEN_WIDTH // 2 - font.size(prompt_text)[0] // 2, prompt_y),
+            bg_color=(0, 0, 0, 160),
+        )
+
+    def _draw_death_screen(self, surface):
+        """Draw the death overlay, message and score"""
+        # Fill background with dark red
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        track(overlay, "HUD", "death overlay")
+        overlay.fill((100, 0, 0))
+        overlay.set_alpha(220)
+        surface.blit(overlay, (0, 0))
+
+        # Show game over message
+        font = get_font("comicsans", 70)
+        death_title = "BABY DOWN!"
+        title_y = SCREEN_HEIGHT // 3 - 30  # Moved 30px higher
+
+        draw_text(
+            surface,
+            death_title,
+            font,
+            (255, 255, 255),
+            (SCREEN_WIDTH // 2 - font.size(death_title)[0] // 2, title_y),
+            shadow_offset=3,
+            bg_color=(100, 0, 0, 200),
+        )
+
+        # Show funny death message
+        font = get_font("comicsans", 40)
+        message_y = title_y + 180  # Increased from 150 to 180
+
+        # Split long messages across multiple lines if needed
+        if len(self.current_death_message) > 40:
+            words = self.current_death_message.split()
+            lines = []
+            current_line = ""
+
+            for word in words:
+                test_line = current_line + " " + word if current_line else word
+                if font.size(test_line)[0] < SCREEN_WIDTH - 200:
+                    current_line = test_line
+                else:
+                    lines.append(current_line)
+                    current_line = word
+
+            if current_line:
+                lines.append(current_line)
+
+            # Draw each line
+            for i, line in enumerate(lines):
+                draw_text(
+                    surface,
+                    line,
+                    font,
+                    (255, 200, 200),
+                    (
+                        SCREEN_WIDTH // 2 - font.size(line)[0] // 2,
+                        message_y + i * 45,
+                    ),
+                    bg_color=(80, 0, 0, 180),
+                )
+        else:
+            draw_text(
+                surface,
+                self.current_death_message,
+                font,
+                (255, 200, 200),
+                (
+                    SCREEN_WIDTH // 2 - font.size(self.current_death_message)[0] // 2,
+                    message_y,
+                ),
+                bg_color=(80, 0, 0, 180),
+            )
+
+        # Show score
+        score_text = f"Score: {self.score + self.level.score}"
+        score_y = message_y + 130  # Increased from 100 to 130
+        draw_text(
+            surface,
+            score_text,
+            font,
+            (255, 255, 0),
+            (SCREEN_WIDTH // 2 - font.size(score_text)[0] // 2, score_y),
+            bg_color=(60, 30, 0, 180),
+        )
+
+        # Continue prompt
+        prompt_text = "Press ENTER to return to menu"
+        prompt_y = score_y + 130  # Increased from 100 to 130
+        draw_text(
+            surface,
+            prompt_text,
+            font,
+            (200, 200, 200),
+            (SCREEN_WIDTH // 2 - font.size(prompt_text)[0] // 2, prompt_y),
+            bg_color=(0, 0, 0, 160),
+        )
+
+    def _draw_game_over_screen(self, surface):
+        """Draw the victory overlay and final score"""
+        # Create a victory overlay
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        track(overlay, "HUD", "victory overlay")
+        overlay.fill((0, 50, 0, 200))  # Dark green with transparency
+        surface.blit(overlay, (0, 0))
+
+        # Show game over screen
+        font = get_font("comicsans", 70)
+        complete_text = "Game Completed!"
+        title_y = SCREEN_HEIGHT // 3
+
+        draw_text(
+            surface,
+            complete_text,
+            font,
+            (255, 0, 0),
+            (SCREEN_WIDTH // 2 - font.size(complete_text)[0] // 2, title_y),
+            shadow_offset=3,
+            bg_color=(0, 70, 0, 180),
+        )
+
+        # Add John Cena victory message
+        cena_text = "Champ life ain't easy!"
+        cena_y = title_y + 85
+        font_cena = get_font("comicsans", 40)
+
+        draw_text(
+            surface,
+            cena_text,
+            font_cena,
+            (255, 255, 255),
+            (SCREEN_WIDTH // 2 - font_cena.size(cena_text)[0] // 2, cena_y),
+            shadow_offset=2,
+            bg_color=(100, 50, 150, 200),
+        )
+
+        # Show final score
+        score_text = f"Final Score: {self.score}"
+        score_y = cena_y + 80  # Adjusted position to account for new message
+        font = get_font("comicsans", 50)
+
+        draw_text(
+            surface,
+            score_text,
+            font,
+            (255, 255, 0),
+            (SCREEN_WIDTH // 2 - font.size(score_text)[0] // 2, score_y),
+            bg_color=(0, 60, 0, 180),
+        )
+
+        # Play again prompt
+        font = get_font("comicsans", 40)
+        restart_text = "Press ENTER to play again"
+        restart_y = score_y + 100
+
+        draw_text(
+            surface,
+            restart_text,
+            font,
+            (200, 200, 200),
+            (SCREEN_WIDTH // 2 - font.size(restart_text)[0] // 2, restart_y),
+            bg_color=(0, 0, 0, 160),
+        )
+
     def run(self):
         """Main game loop"""
         running = True
 
         while running:
+            frame_start = time.perf_counter()
+
             # Event handling
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
 
+                # The window's contents may have been lost, so present it all
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.full_present = True
+
                 # Global key controls
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_m:
                         self.toggle_music()
+                    elif event.key == pygame.K_F9:
+                        # Write a memory report for checking budgets
+                        memory_registry.dump()
 
                 # Handle menu selection
                 if self.state == MENU:
@@ -333,248 +641,69 @@ class Game:
                             self.current_level = 1
                             self.score = 0
 
-            # Update and render based on game state
+            # Static screens are composed over the last frame of the previous state
+            if self.state not in STATIC_SCREENS:
+                self.static_screen_key = None
+
+            # Update and render based on game state. Each state returns the rects
+            # it changed, or None if the whole screen changed.
+            dirty = None
             if self.state == MENU:
                 self.menu.update()
-                self.menu.render(screen)
+                dirty = self.menu.render(screen)
 
             elif self.state == PLAYING:
                 result = self.level.update()
                 self.level.render(screen)
+                self._post_process(self.level.player)
 
                 if result is True:  # Level completed (True)
                     self.complete_level()
                 elif result is False:  # Player died (False)
-                    self.player_died()
+                    self.start_dying()
 
             elif self.state == BOSS_LEVEL:
                 # Handle boss level state
                 result = self.boss_level.update()
                 self.boss_level.render(screen)
+                self._post_process(self.boss_level.player)
 
                 if result is True:  # Boss defeated (True)
                     self.complete_boss()
                 elif result is False:  # Player died (False)
-                    self.player_died()
-
-            elif self.state == LEVEL_COMPLETE:
-                # Create a semi-transparent overlay
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 180))  # Black with 70% transparency
-                screen.blit(overlay, (0, 0))
-
-                # Show level complete screen
-                font = pygame.font.SysFont("comicsans", 70)
-                level_complete_text = f"Level {self.current_level - 1} Complete!"
-
-                # Draw title with background
-                title_y = SCREEN_HEIGHT // 3
-                render_text_with_shadow(
-                    screen,
-                    level_complete_text,
-                    font,
-                    (255, 255, 0),
-                    (
-                        SCREEN_WIDTH // 2 - font.size(level_complete_text)[0] // 2,
-                        title_y,
-                    ),
-                    shadow_offset=3,
-                    bg_color=(50, 50, 100, 180),
-                )
-
-                # Show funny completion message
-                messages = {
-                    1: "Those veggies got SERVED!",
-                    2: "Bananas? More like SPLIT!",
-                    3: "Grandmas sent back to bingo night!",
-                }
-
-                message_text = messages.get(self.current_level - 1, "")
-                font = pygame.font.SysFont("comicsans", 40)
-
-                # Draw message with background
-                message_y = title_y + 120
-                render_text_with_shadow(
-                    screen,
-                    message_text,
-                    font,
-                    (255, 255, 255),
-                    (SCREEN_WIDTH // 2 - font.size(message_text)[0] // 2, message_y),
-                    bg_color=(50, 100, 50, 160),
-                )
+                    self.start_dying()
 
-                # Continue prompt
-                prompt_text = "Press ENTER to continue..."
-                prompt_y = message_y + 100
-                render_text_with_shadow(
-                    screen,
-                    prompt_text,
-                    font,
-                    (200, 200, 200),
-                    (SCREEN_WIDTH // 2 - font.size(prompt_text)[0] // 2, prompt_y),
-                    bg_color=(0, 0, 0, 160),
-                )
-
-            elif self.state == PLAYER_DIED:
-                # Fill background with dark red
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.fill((100, 0, 0))
-                overlay.set_alpha(220)
-                screen.blit(overlay, (0, 0))
-
-                # Show game over message
-                font = pygame.font.SysFont("comicsans", 70)
-                death_title = "BABY DOWN!"
-                title_y = SCREEN_HEIGHT // 3 - 30  # Moved 30px higher
-
-                render_text_with_shadow(
-                    screen,
-                    death_title,
-                    font,
-                    (255, 255, 255),
-                    (SCREEN_WIDTH // 2 - font.size(death_title)[0] // 2, title_y),
-                    shadow_offset=3,
-                    bg_color=(100, 0, 0, 200),
-                )
-
-                # Show funny death message
-                font = pygame.font.SysFont("comicsans", 40)
-                message_y = title_y + 180  # Increased from 150 to 180
-
-                # Split long messages across multiple lines if needed
-                if len(self.current_death_message) > 40:
-                    words = self.current_death_message.split()
-                    lines = []
-                    current_line = ""
-
-                    for word in words:
-                        test_line = current_line + " " + word if current_line else word
-                        if font.size(test_line)[0] < SCREEN_WIDTH - 200:
-                            current_line = test_line
-                        else:
-                            lines.append(current_line)
-                            current_line = word
-
-                    if current_line:
-                        lines.append(current_line)
-
-                    # Draw each line
-                    for i, line in enumerate(lines):
-                        render_text_with_shadow(
-                            screen,
-                            line,
-                            font,
-                            (255, 200, 200),
-                            (
-                                SCREEN_WIDTH // 2 - font.size(line)[0] // 2,
-                                message_y + i * 45,
-                            ),
-                            bg_color=(80, 0, 0, 180),
-                        )
+            elif self.state == PLAYER_DYING:
+                # The level stays still while the death tint fades in
+                if self.current_level > self.max_levels:
+                    level = self.boss_level
                 else:
-                    render_text_with_shadow(
-                        screen,
-                        self.current_death_message,
-                        font,
-                        (255, 200, 200),
-                        (
-                            SCREEN_WIDTH // 2
-                            - font.size(self.current_death_message)[0] // 2,
-                            message_y,
-                        ),
-                        bg_color=(80, 0, 0, 180),
-                    )
-
-                # Show score
-                score_text = f"Score: {self.score + self.level.score}"
-                score_y = message_y + 130  # Increased from 100 to 130
-                render_text_with_shadow(
-                    screen,
-                    score_text,
-                    font,
-                    (255, 255, 0),
-                    (SCREEN_WIDTH // 2 - font.size(score_text)[0] // 2, score_y),
-                    bg_color=(60, 30, 0, 180),
+                    level = self.level
+                self.death_timer -= 1
+                post_process.set_death_amount(
+                    1 - self.death_timer / DEATH_TRANSITION_FRAMES
                 )
+                level.render(screen)
+                self._post_process(level.player)
 
-                # Continue prompt
-                prompt_text = "Press ENTER to return to menu"
-                prompt_y = score_y + 130  # Increased from 100 to 130
-                render_text_with_shadow(
-                    screen,
-                    prompt_text,
-                    font,
-                    (200, 200, 200),
-                    (SCREEN_WIDTH // 2 - font.size(prompt_text)[0] // 2, prompt_y),
-                    bg_color=(0, 0, 0, 160),
-                )
-
-            elif self.state == GAME_OVER:
-                # Create a victory overlay
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 50, 0, 200))  # Dark green with transparency
-                screen.blit(overlay, (0, 0))
-
-                # Show game over screen
-                font = pygame.font.SysFont("comicsans", 70)
-                complete_text = "Game Completed!"
-                title_y = SCREEN_HEIGHT // 3
-
-                render_text_with_shadow(
-                    screen,
-                    complete_text,
-                    font,
-                    (255, 0, 0),
-                    (SCREEN_WIDTH // 2 - font.size(complete_text)[0] // 2, title_y),
-                    shadow_offset=3,
-                    bg_color=(0, 70, 0, 180),
-                )
-
-                # Add John Cena victory message
-                cena_text = "Champ life ain't easy!"
-                cena_y = title_y + 85
-                font_cena = pygame.font.SysFont("comicsans", 40)
-
-                render_text_with_shadow(
-                    screen,
-                    cena_text,
-                    font_cena,
-                    (255, 255, 255),
-                    (SCREEN_WIDTH // 2 - font_cena.size(cena_text)[0] // 2, cena_y),
-                    shadow_offset=2,
-                    bg_color=(100, 50, 150, 200),
-                )
-
-                # Show final score
-                score_text = f"Final Score: {self.score}"
-                score_y = cena_y + 80  # Adjusted position to account for new message
-                font = pygame.font.SysFont("comicsans", 50)
-
-                render_text_with_shadow(
-                    screen,
-                    score_text,
-                    font,
-                    (255, 255, 0),
-                    (SCREEN_WIDTH // 2 - font.size(score_text)[0] // 2, score_y),
-                    bg_color=(0, 60, 0, 180),
-                )
-
-                # Play again prompt
-                font = pygame.font.SysFont("comicsans", 40)
-                restart_text = "Press ENTER to play again"
-                restart_y = score_y + 100
-
-                render_text_with_shadow(
-                    screen,
-                    restart_text,
-                    font,
-                    (200, 200, 200),
-                    (SCREEN_WIDTH // 2 - font.size(restart_text)[0] // 2, restart_y),
-                    bg_color=(0, 0, 0, 160),
-                )
+                if self.death_timer <= 0:
+                    self.player_died()
 
-            # Update display and maintain frame rate
-            pygame.display.update()
+            elif self.state in STATIC_SCREENS:
+                # End-of-level screens don't change, so they're composed once
+                dirty = self._render_static_screen()
+
+            # Update display and maintain frame rate. Frames where nothing
+            # changed aren't presented at all.
+            if not DIRTY_RECTS or dirty is None or self.full_present:
+                screen.present()
+                self.full_present = False
+            elif dirty:
+                screen.present(dirty)
+
+            # Frame time without the wait for the next frame
+            if resolution_scaler:
+                resolution_scaler.add_frame((time.perf_counter() - frame_start) * 1000)
             clock.tick(FPS)
 
         pygame.quit()
@@ -0,0 +1,58 @@
+import os
+import pygame
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game import backend
+from game.backend import REPLAY_LIMIT, TextureBackend
+
+SIZE = (320, 240)
+
+
+@pytest.fixture
+def texture_backend():
+    if backend.Window is None:
+        pytest.skip("pygame._sdl2.video is not available")
+    pygame.display.init()
+    try:
+        screen = TextureBackend(SIZE, "test")
+    except Exception as e:
+        pygame.display.quit()
+        pytest.skip(f"no SDL renderer: {e}")
+    yield screen
+    screen.window.destroy()
+    pygame.display.quit()
+
+
+def test_partial_presents_over_a_full_redraw_stay_bounded(texture_backend):
+    sprite = pygame.Surface((16, 16))
+    texture_backend.fill((0, 0, 0))
+    texture_backend.present()
+    for i in range(200):
+        # A full-screen opaque fill hides everything drawn before it
+        if i % 10 == 0:
+            texture_backend.fill((20, 30, 40))
+        rect = texture_backend.blit(sprite, (i % 300, 100))
+        texture_backend.present([rect])
+    assert len(texture_backend._last_frame) <= 11
+
+
+def test_partial_presents_stay_bounded(texture_backend):
+    sprite = pygame.Surface((16, 16), pygame.SRCALPHA)
+    sprite.fill((255, 0, 0, 128))
+    for i in range(3 * REPLAY_LIMIT):
+        rect = texture_backend.blit(sprite, (i % 300, i % 220))
+        texture_backend.present([rect])
+        assert len(texture_backend._last_frame) <= REPLAY_LIMIT + 1
+    # The first sprite survives being folded into a snapshot
+    assert texture_backend.copy().get_at((1, 1))[0] > 0
+
+
+def test_empty_presents_keep_the_frame(texture_backend):
+    texture_backend.fill((10, 200, 30))
+    texture_backend.present()
+    for _ in range(50):
+        texture_backend.present([])
+    assert len(texture_backend._last_frame) == 1
+    assert texture_backend.copy().get_at((5, 5))[:3] == (10, 200, 30)
@@ -0,0 +1,32 @@
+import glob
+import os
+import pytest
+import build_pack
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def in_repo_root(monkeypatch):
+    # Source files are listed relative to the repository root, when the
+    # module is imported
+    monkeypatch.chdir(ROOT)
+    sources = ["main.py"] + sorted(glob.glob("game/*.py"))
+    monkeypatch.setattr(build_pack, "SOURCE_FILES", sources)
+
+
+def test_sound_name_re_allows_trailing_arguments():
+    code = 'sound_bank.get("hit", owner="Player")\nsound_bank.get( \'jump\')'
+    assert build_pack.SOUND_NAME_RE.findall(code) == ["hit", "jump"]
+
+
+def test_find_asset_references_includes_sounds():
+    references = build_pack.find_asset_references()
+    for filename in (
+        "hit.wav",
+        "jump.wav",
+        "enemy_shoot.wav",
+        "level_complete.wav",
+        "boss_music.mp3",
+    ):
+        assert f"assets/sounds/{filename}" in references
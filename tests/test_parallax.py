@@ -0,0 +1,66 @@
+import pygame
+import pytest
+
+from game.parallax import ParallaxBackground, ParallaxLayer, compose_strip
+
+
+def _fill(strip, offset_x):
+    strip.fill((offset_x % 256, 0, 0), (offset_x, 0, 100, strip.get_height()))
+
+
+def test_compose_strip_covers_min_width_in_whole_periods():
+    strip = compose_strip(100, 10, 250, _fill)
+    assert strip.get_size() == (300, 10)
+
+
+@pytest.mark.parametrize("factor, left", [(0.25, 250), (0.5, 200), (0.75, 150)])
+def test_layer_wraps_in_two_blits_below_camera_speed(factor, left):
+    strip = pygame.Surface((300, 10))
+    blits = []
+    ParallaxLayer(strip, factor).queue(blits, 1000, 200)
+    first = 300 - left
+    assert blits == [
+        (strip, (0, 0), pygame.Rect(left, 0, first, 10)),
+        (strip, (first, 0), pygame.Rect(0, 0, 200 - first, 10)),
+    ]
+
+
+def test_layer_takes_one_blit_when_it_doesnt_wrap():
+    strip = pygame.Surface((300, 10))
+    blits = []
+    ParallaxLayer(strip, 0.5).queue(blits, 100, 200)
+    assert blits == [(strip, (0, 0), pygame.Rect(50, 0, 200, 10))]
+
+
+def test_wrapped_layer_covers_the_screen_seamlessly():
+    strip = compose_strip(100, 10, 200, _fill)
+    layer = ParallaxLayer(strip, 0.5)
+    screen = pygame.Surface((200, 10))
+    for camera_x in range(0, 1000, 37):
+        blits = []
+        layer.queue(blits, camera_x, 200)
+        assert sum(area.width for _, _, area in blits) == 200
+        screen.blits(blits, doreturn=False)
+        # Every screen column shows the strip column camera_x * 0.5 along
+        for x in (0, 99, 199):
+            column = (int(camera_x * 0.5) + x) % strip.get_width()
+            assert screen.get_at((x, 0)) == strip.get_at((column, 0))
+
+
+def test_layers_scroll_at_their_own_speeds():
+    far = ParallaxLayer(pygame.Surface((400, 20)), 0.5)
+    near = ParallaxLayer(pygame.Surface((400, 5), pygame.SRCALPHA), 0.75, y=15)
+    background = ParallaxBackground(200, 20, [far])
+    background.add_layer(near)
+    assert background.covers_screen
+
+    blits = []
+    for layer in background.layers:
+        layer.queue(blits, 100, 200)
+    assert [(dest, area.x) for _, dest, area in blits] == [((0, 0), 50), ((0, 15), 75)]
+
+
+def test_transparent_layers_dont_cover_the_screen():
+    background = ParallaxBackground(200, 20)
+    background.add_layer(ParallaxLayer(pygame.Surface((400, 20), pygame.SRCALPHA), 1))
+    assert not background.covers_screen